@@ -7,10 +7,124 @@ import re
 import json
 import os
 import logging
-from typing import Dict, List, Any
+import threading
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile a pattern once per process, shared by every config and parser"""
+    return re.compile(pattern, flags)
+
+# Line-level patterns shared by the extractor and parsers
+BALANCE_RE = re.compile(r'[0-9,]+\.\d{2}(\s|$)')
+VALUE_DATE_RE = re.compile(r'\([0-9]{2}-[A-Za-z]{3}-[0-9]{2,4}\)')
+
+# Header/info rows, matched case-insensitively at the start of a line
+HEADER_PREFIXES = ("ACCOUNT", "BRANCH", "CRN", "IFSC", "MICR", "ELINT", "TRANSACTION", "#")
+HEADER_PREFIX_LEN = max(len(prefix) for prefix in HEADER_PREFIXES)
+
+def is_header_line(line: str) -> bool:
+    """Check if line is blank or starts with a known header prefix"""
+    return not line.strip() or line[:HEADER_PREFIX_LEN].upper().startswith(HEADER_PREFIXES)
+
+class DualEnginePattern:
+    """Line pattern matched with RE2 (linear time) on ASCII text and with re otherwise"""
+    
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self._re = compile_pattern(pattern)
+        self._re2 = re2.compile(pattern)
+    
+    def _engine(self, text: str):
+        # RE2 classes are ASCII-only and its $ ignores a trailing newline
+        if text.isascii() and not text.endswith('\n'):
+            return self._re2
+        return self._re
+    
+    def match(self, text: str):
+        return self._engine(text).match(text)
+    
+    def search(self, text: str):
+        return self._engine(text).search(text)
+
+# A regex that matches only itself once its backslash escapes are removed, e.g. 0\.01
+_LITERAL_PATTERN_RE = re.compile(r'(?:[^\\.^$*+?{}\[\]|()]|\\[^A-Za-z0-9])+')
+
+class SuspiciousPatternMatcher:
+    """Counts the narratives that contain each suspicious pattern, ignoring case
+    
+    When every pattern is a plain ASCII literal and pyahocorasick is installed, one
+    Aho-Corasick pass per narrative finds them all; otherwise each pattern is searched
+    with str.contains.
+    """
+    
+    def __init__(self, patterns: List[str]):
+        self.patterns = tuple(patterns)
+        for pattern in self.patterns:
+            # Capturing groups have no meaning for a yes/no search and pandas warns on
+            # them, but they still count correctly; (?:...) groups avoid the warning
+            if compile_pattern(pattern).groups:
+                logger.warning(f"Suspicious pattern {pattern!r} has a capturing group; (?:...) is preferred")
+        self._regexes = tuple(compile_pattern(pattern, re.IGNORECASE) for pattern in self.patterns)
+        self._automaton = self._build_automaton(self.patterns)
+    
+    @staticmethod
+    def _build_automaton(patterns: Tuple[str, ...]) -> Optional[Any]:
+        """Automaton over the lowercased literals, or None if any pattern needs a regex"""
+        if ahocorasick is None or not patterns:
+            return None
+        literals = []
+        for pattern in patterns:
+            # Lowercasing agrees with re.IGNORECASE only for ASCII literals
+            if not (pattern.isascii() and _LITERAL_PATTERN_RE.fullmatch(pattern)):
+                return None
+            literals.append(re.sub(r'\\(.)', r'\1', pattern).lower())
+        automaton = ahocorasick.Automaton()
+        for i, literal in enumerate(literals):
+            # Patterns that unescape to the same literal share one key
+            automaton.add_word(literal, automaton.get(literal, ()) + (i,))
+        automaton.make_automaton()
+        return automaton
+    
+    def count(self, narratives) -> List[int]:
+        """Number of narratives matching each pattern, in pattern order"""
+        if self._automaton is None:
+            return [int(narratives.str.contains(pattern, case=False, na=False).sum()) for pattern in self.patterns]
+        counts = [0] * len(self.patterns)
+        for narrative in narratives.tolist():
+            if not isinstance(narrative, str):
+                continue
+            if narrative.isascii():
+                # A pattern counts once per narrative, however often it occurs
+                found = {i for _, indices in self._automaton.iter(narrative.lower()) for i in indices}
+            else:
+                # re.IGNORECASE also matches some non-ASCII letters, e.g. 'ſ' for 's'
+                found = [i for i, regex in enumerate(self._regexes) if regex.search(narrative)]
+            for i in found:
+                counts[i] += 1
+        return counts
+
+def _collect_hyperscan_match(pattern_id, start, end, flags, matched):
+    matched.append(pattern_id)
+
 class ExtractorConfig:
     """Configuration class for the bank statement extractor."""
     
@@ -19,6 +133,113 @@ class ExtractorConfig:
         self.date_patterns = self._get_date_patterns()
         self.amount_patterns = self._get_amount_patterns()
         self.validation_results = {}
+        
+        self._use_re2 = self.config.get("regex_engine") == "re2"
+        if self._use_re2 and re2 is None:
+            logger.warning("regex_engine 're2' requested but google-re2 is not installed. Using re.")
+            self._use_re2 = False
+        
+        # Precompiled patterns for the per-line hot path (tuples: the instance is shared)
+        self.compiled_date_patterns = tuple(compile_pattern(p) for p in self.date_patterns)
+        self.compiled_amount_patterns = tuple(compile_pattern(p) for p in self.amount_patterns)
+        self.compiled_transaction_patterns = tuple(self._compile_line_pattern(p) for p in self.transaction_patterns)
+        self._sbi_patterns = {name: self._compile_line_pattern(p) for name, p in self._get_sbi_patterns().items()}
+        self.compiled_currency_patterns = {
+            currency: (info["symbol"], tuple(compile_pattern(p) for p in info["patterns"]))
+            for currency, info in self.currencies.items()
+        }
+        
+        # Fused alternations: one scan per line instead of one per pattern
+        self.any_date_re = self._join_patterns(self.date_patterns)
+        # Same alternation with one named group per format, to tell which one matched
+        self.date_alternation_re = compile_pattern("|".join(f"(?P<d{i}>{p})" for i, p in enumerate(self.date_patterns)))
+        self.any_amount_re = self._join_patterns(self.amount_patterns)
+        self.suspicious_matcher = SuspiciousPatternMatcher(self.validation_rules["suspicious_patterns"])
+        self.currency_groups = {}
+        currency_alternatives = []
+        for idx, (currency, info) in enumerate(self.currencies.items()):
+            group = f"c{idx}"
+            self.currency_groups[group] = (currency, info["symbol"])
+            currency_alternatives.append(f"(?P<{group}>{'|'.join(info['patterns'])})")
+        self.currency_re = compile_pattern("|".join(currency_alternatives))
+        
+        # Optional multi-pattern prefilter: one scan tells which transaction patterns can match.
+        # Hyperscan is preferred, the RE2 set is the fallback.
+        self.transaction_hs_db = self._build_hyperscan_db(self.transaction_patterns)
+        self._hs_local = threading.local()
+        self.transaction_set = None
+        if self.transaction_hs_db is None:
+            self.transaction_set = self._build_pattern_set(self.transaction_patterns)
+        self._all_transaction_ids = tuple(range(len(self.transaction_patterns)))
+    
+    def _compile_line_pattern(self, pattern: str):
+        """Compile a full-line pattern with the configured regex engine"""
+        if self._use_re2:
+            try:
+                return DualEnginePattern(pattern)
+            except Exception as e:
+                logger.warning(f"RE2 cannot compile {pattern!r}: {e}. Using re.")
+        return compile_pattern(pattern)
+    
+    @staticmethod
+    def _build_pattern_set(patterns: List[str]) -> Optional[Any]:
+        """Compile patterns into an RE2 set, or None if RE2 is unavailable"""
+        if re2 is None:
+            return None
+        try:
+            pattern_set = re2.Set.SearchSet()
+            for pattern in patterns:
+                pattern_set.Add(pattern)
+            pattern_set.Compile()
+            return pattern_set
+        except Exception as e:
+            logger.warning(f"Could not build RE2 pattern set: {e}. Using re only.")
+            return None
+    
+    @staticmethod
+    def _build_hyperscan_db(patterns: List[str]) -> Optional[Any]:
+        """Compile patterns into a Hyperscan database, or None if Hyperscan is unavailable"""
+        if hyperscan is None:
+            return None
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[p.encode('ascii') for p in patterns],
+                ids=list(range(len(patterns))),
+                elements=len(patterns),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns),
+            )
+            return db
+        except Exception as e:
+            logger.warning(f"Could not build Hyperscan database: {e}. Trying RE2.")
+            return None
+    
+    def _hs_scratch(self):
+        """Per-thread Hyperscan scratch space (scratch cannot be shared between threads)"""
+        scratch = getattr(self._hs_local, "scratch", None)
+        if scratch is None:
+            scratch = self._hs_local.scratch = hyperscan.Scratch(self.transaction_hs_db)
+        return scratch
+    
+    def transaction_candidates(self, line: str) -> Tuple[int, ...]:
+        """Indices of transaction patterns that may match line, in priority order"""
+        # Hyperscan and RE2 classes are ASCII-only and their $ ignores a trailing newline,
+        # so only trust the prefilter where they agree with re
+        if not line.isascii() or line.endswith('\n'):
+            return self._all_transaction_ids
+        if self.transaction_hs_db is not None:
+            matched = []
+            self.transaction_hs_db.scan(
+                line.encode('ascii'),
+                match_event_handler=_collect_hyperscan_match,
+                context=matched,
+                scratch=self._hs_scratch(),
+            )
+            return tuple(sorted(matched))
+        if self.transaction_set is None:
+            return self._all_transaction_ids
+        matched = self.transaction_set.Match(line)
+        return tuple(sorted(matched)) if matched else ()
     
     def _load_config(self, config_file: str) -> Dict[str, Any]:
         """Load enhanced bank-specific configuration"""
@@ -38,19 +259,22 @@ class ExtractorConfig:
                 "EUR": {"symbol": "€", "patterns": [r"€", r"EUR"]},
                 "GBP": {"symbol": "£", "patterns": [r"£", r"GBP"]},
             },
+            # Narrative groups start with \S so the preceding \s+ cannot backtrack into them
             "transaction_patterns": [
                 # Pattern 1: Standard format with reference number
-                r'^(\d+)\s+(\d{2}\s+\w{3}\s+\d{4})\s+(\d{2}\s+\w{3}\s+\d{4})\s+(.+?)\s+([A-Z0-9/]+)\s+([+-]?[0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})$',
+                r'^(\d+)\s+(\d{2}\s+\w{3}\s+\d{4})\s+(\d{2}\s+\w{3}\s+\d{4})\s+(\S.*?)\s+([A-Z0-9/]+)\s+([+-]?[0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})$',
                 # Pattern 2: Without reference number
-                r'^(\d+)\s+(\d{2}\s+\w{3}\s+\d{4})\s+(\d{2}\s+\w{3}\s+\d{4})\s+(.+?)\s+([+-]?[0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})$',
+                r'^(\d+)\s+(\d{2}\s+\w{3}\s+\d{4})\s+(\d{2}\s+\w{3}\s+\d{4})\s+(\S.*?)\s+([+-]?[0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})$',
                 # Pattern 3: Different date format
-                r'^(\d+)\s+(\d{2}/\d{2}/\d{4})\s+(\d{2}/\d{2}/\d{4})\s+(.+?)\s+([+-]?[0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})$',
+                r'^(\d+)\s+(\d{2}/\d{2}/\d{4})\s+(\d{2}/\d{2}/\d{4})\s+(\S.*?)\s+([+-]?[0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})$',
                 # Pattern 4: Minimal format
                 r'^(\d+)\s+(\d{2}\s+\w{3}\s+\d{4})\s+(\d{2}\s+\w{3}\s+\d{4})',
                 # Pattern 5: New format with separate debit/credit columns
-                r'^(\d+)\s+(\d{2}\s+\w{3}\s+\d{4})\s+(.+?)\s+([A-Z0-9/]+)\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})$',
-                r'^(\d+)\s+(\d{2}\s+\w{3}\s+\d{4})\s+(.+?)\s+([A-Z0-9/]+)\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})$',
+                r'^(\d+)\s+(\d{2}\s+\w{3}\s+\d{4})\s+(\S.*?)\s+([A-Z0-9/]+)\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})$',
+                r'^(\d+)\s+(\d{2}\s+\w{3}\s+\d{4})\s+(\S.*?)\s+([A-Z0-9/]+)\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})$',
             ],
+            # "re2" matches line patterns in guaranteed linear time (needs google-re2)
+            "regex_engine": "re",
             "validation_rules": {
                 "min_amount": 1.0,
                 "max_amount": 1000000000,  # 1 billion
@@ -98,6 +322,11 @@ class ExtractorConfig:
                 patterns.append(r'\d{2}-\d{2}-\d{2}')
         return patterns
     
+    @staticmethod
+    def _join_patterns(patterns: List[str]) -> re.Pattern:
+        """Compile a list of patterns into a single alternation"""
+        return compile_pattern("|".join(f"(?:{p})" for p in patterns))
+    
     def _get_amount_patterns(self) -> List[str]:
         """Generate regex patterns for different amount formats"""
         return [
@@ -107,6 +336,14 @@ class ExtractorConfig:
             r'[+-]?[0-9]+',  # Simple: +1234
         ]
     
+    def _get_sbi_patterns(self) -> Dict[str, str]:
+        """Regex patterns for the SBI statement line formats"""
+        return {
+            "line1": r'^(\d{2}-\w{3}-\d{2,4})\s+(TO|BY)\s+(\S.*?)\s+([0-9,]+\.\d{2})\s+([+-]?[0-9,]+\.\d{2})$',
+            "line2": r'^\((\d{2}-\w{3}-\d{2,4})\)\s*(.*)$',
+            "traditional": r'^(\d{2}-\w{3}-\d{2,4})\s*\((\d{2}-\w{3}-\d{2,4})\)\s+(\S.*?)\s+([\w/-]+)\s+([0-9,]+\.\d{2}|-)\s+([0-9,]+\.\d{2}|-)\s+([+-]?[0-9,]+\.\d{2})$'
+        }
+    
     @property
     def date_formats(self):
         return self.config["date_formats"]
@@ -125,14 +362,15 @@ class ExtractorConfig:
     
     @property
     def sbi_patterns(self):
-        return {
-            "line1": r'^(\d{2}-\w{3}-\d{2,4})\s+(TO|BY)\s+(.+?)\s+([0-9,]+\.\d{2})\s+([+-]?[0-9,]+\.\d{2})$',
-            "line2": r'^\((\d{2}-\w{3}-\d{2,4})\)\s*(.*)$',
-            "traditional": r'^(\d{2}-\w{3}-\d{2,4})\s*\((\d{2}-\w{3}-\d{2,4})\)\s+(.+?)\s+([\w/-]+)\s+([0-9,]+\.\d{2}|-)\s+([0-9,]+\.\d{2}|-)\s+([+-]?[0-9,]+\.\d{2})$'
-        }
+        return self._sbi_patterns
     
     def get_config(self) -> Dict[str, Any]:
         """Get complete configuration as dictionary."""
         config = self.config.copy()
-        config["sbi_patterns"] = self.sbi_patterns
-        return config 
\ No newline at end of file
+        config["sbi_patterns"] = {name: pattern.pattern for name, pattern in self.sbi_patterns.items()}
+        return config
+
+@lru_cache(maxsize=None)
+def get_config(config_file: Optional[str] = None) -> ExtractorConfig:
+    """Return the shared configuration for config_file, building it on first use"""
+    return ExtractorConfig(config_file)
@@ -2,49 +2,164 @@
 Main extractor module that orchestrates all components.
 """
 
+from __future__ import annotations
+
 import os
 import re
 import json
 import logging
-import pdfplumber
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache, partial
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple, Any, Callable, TYPE_CHECKING
 
-from .config import ExtractorConfig
+from .config import get_config, BALANCE_RE, VALUE_DATE_RE, is_header_line
 from .parsers import SBIParser, UniversalParser, PNBParser
-from .validators import DataValidator
+
+# pandas, numpy, pdfplumber, pyarrow and the validators are imported on first
+# use to keep start-up fast; PyMuPDF is light and is the default PDF backend
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+try:
+    import pymupdf as fitz
+except ImportError:
+    try:
+        import fitz
+    except ImportError:
+        fitz = None
 
 logger = logging.getLogger(__name__)
 
+# Set to "pdfplumber" to skip PyMuPDF (e.g. where its AGPL license is a concern)
+PDF_BACKEND_ENV = "BANK_EXTRACTOR_PDF_BACKEND"
+
+# Upper bound on threads parsing the pages of one PDF
+MAX_PAGE_WORKERS = 8
+
+# Currency is a document-level property, detected from the start of the text
+CURRENCY_SCAN_CHARS = 4096
+
+# Lower-cased bank names looked for on the first page, checked in order
+BANK_MARKERS = (
+    ("PNB", "punjab national bank"),
+    ("SBI", "state bank of india"),
+)
+
+# Narrative clean-up, applied column-wise with the .str accessor
+NARR_WS_RE = re.compile(r'\s+')
+NARR_LEAD_NUM_RE = re.compile(r'^\d+\s*')
+NARR_CHARS_RE = re.compile(r'[^\w\s\-\./]')
+
+# Keys produced by the parsers, in output column order
+TRANSACTION_FIELDS = ['Transaction Date', 'Narrative', 'Amount', 'Balance']
+
+
+@lru_cache(maxsize=None)
+def _pyarrow_csv() -> Optional[Tuple[Any, Any]]:
+    """Import pyarrow and its CSV module on first use, or None if unavailable."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return None
+    return pa, pa_csv
+
+
+def _arrow_formats_like_repr(values: np.ndarray) -> bool:
+    """Whether Arrow's float-to-string cast gives repr() for every value, ignoring NaN."""
+    import numpy as np
+    
+    # Below 1e-4 and from 1e10 up Arrow and repr() switch to exponents differently
+    magnitude = np.abs(values[~np.isnan(values)])
+    return bool(np.all((magnitude == 0) | ((magnitude >= 1e-4) & (magnitude < 1e10))))
+
+
+def _float_columns_as_text(pa: Any, table: Any) -> Any:
+    """Cast float columns to text as pandas writes them: Arrow drops the ".0" of whole numbers."""
+    import pyarrow.compute as pc
+    
+    for i, field in enumerate(table.schema):
+        if pa.types.is_floating(field.type):
+            column = table.column(i)
+            if not _arrow_formats_like_repr(column.to_numpy()):
+                raise ValueError(f"{field.name} has values Arrow formats unlike pandas")
+            text = pc.cast(column, pa.string())
+            whole = pc.match_substring_regex(text, r'^-?\d+$')
+            text = pc.if_else(whole, pc.binary_join_element_wise(text, '.0', ''), text)
+            table = table.set_column(i, field.name, text)
+    return table
+
+
+def _process_one(args: Tuple[str, str, Optional[str]]) -> str:
+    """Process a single PDF in a worker process."""
+    pdf_path, output_dir, config_file = args
+    return CompleteBankExtractor(config_file).extract_and_fix_transactions(pdf_path, output_dir)
+
+
 class CompleteBankExtractor:
     """Complete bank statement extractor with modular architecture."""
     
-    def __init__(self):
+    def __init__(self, config_file: Optional[str] = None):
         """Initialize the extractor with configuration and components."""
-        self.config = ExtractorConfig()
+        self.config_file = config_file
+        self.config = get_config(config_file)
         self.sbi_parser = SBIParser(self.config)
         self.universal_parser = UniversalParser(self.config)
         self.pnb_parser = PNBParser(self.config)
-        self.validator = DataValidator(self.config)
+        self._validator = None
+        
+        # Page parser per detected bank; unknown statements try every format
+        self._page_parsers = {
+            "SBI": partial(self._parse_page_lines, fall_through=False),
+            "PNB": self.pnb_parser.parse_pnb_transactions,
+            None: self._parse_page_lines,
+        }
+    
+    @property
+    def validator(self):
+        """Data validator, created on first use."""
+        if self._validator is None:
+            from .validators import DataValidator
+            self._validator = DataValidator(self.config)
+        return self._validator
     
     def _detect_currency(self, text: str) -> Tuple[str, str]:
         """Detect currency from text"""
-        for currency, info in self.config.currencies.items():
-            for pattern in info["patterns"]:
-                if re.search(pattern, text):
-                    return currency, info["symbol"]
+        match = self.config.currency_re.search(text)
+        if match:
+            return self.config.currency_groups[match.lastgroup]
         return "INR", "₹"  # Default to INR
     
+    def _document_head(self, pages: List[str]) -> str:
+        """Return the first CURRENCY_SCAN_CHARS characters of the document text"""
+        head = []
+        size = 0
+        for text in pages:
+            if not text:
+                continue
+            head.append(text)
+            size += len(text)
+            if size >= CURRENCY_SCAN_CHARS:
+                break
+        return "\n".join(head)[:CURRENCY_SCAN_CHARS]
+    
     def _is_transaction_line(self, line: str) -> bool:
         """Strictly check if line is a real transaction (date, amount, balance present)"""
+        # Shortest date plus balance is 11 characters and every balance has a
+        # decimal point; reject most lines before any regex runs
+        if len(line) < 10 or '.' not in line:
+            return False
         # Must have a date, an amount, and a balance
-        has_date = any(re.search(pattern, line) for pattern in self.config.date_patterns)
-        has_amount = any(re.search(pattern, line) for pattern in self.config.amount_patterns)
-        has_balance = bool(re.search(r'[0-9,]+\.\d{2}(\s|$)', line))
-        # Must not be a header or info row
-        is_not_header = not re.match(r'^(Account|Branch|CRN|IFSC|MICR|Elint|TRANSACTION|#|\s*$)', line, re.IGNORECASE)
-        return has_date and has_amount and has_balance and is_not_header
+        return bool(
+            self.config.any_date_re.search(line)
+            and self.config.any_amount_re.search(line)
+            and BALANCE_RE.search(line)
+            # Must not be a header or info row
+            and not is_header_line(line)
+        )
     
     def _is_multi_line_transaction(self, lines: List[str], line_index: int) -> bool:
         """Check if current line is part of a multi-line transaction"""
@@ -55,11 +170,22 @@ class CompleteBankExtractor:
         next_line = lines[line_index + 1].strip()
         
         # Check if next line is a continuation (contains date in parentheses)
-        if re.search(r'\([0-9]{2}-[A-Za-z]{3}-[0-9]{2,4}\)', next_line):
+        if VALUE_DATE_RE.search(next_line):
             return True
         
         return False
     
+    def _extract_pages_text(self, pdf_path: str) -> List[str]:
+        """Extract the text of every page, preferring PyMuPDF over pdfplumber."""
+        if fitz is not None and os.environ.get(PDF_BACKEND_ENV, "").lower() != "pdfplumber":
+            with fitz.open(pdf_path) as doc:
+                return [page.get_text("text") for page in doc]
+        
+        import pdfplumber
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            return [page.extract_text() for page in pdf.pages]
+    
     def extract_and_fix_transactions(self, pdf_path: str, output_dir: str = "output") -> str:
         """Extract and fix transactions from PDF."""
         try:
@@ -74,71 +200,30 @@ class CompleteBankExtractor:
             logger.info(f"🔄 Extracting and fixing transactions from {pdf_path}")
             
             transactions = []
-            currency = "INR"
-            symbol = "₹"
             
             # Extract text from PDF
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    logger.info(f"Processing page {page_num}")
-                    
-                    text = page.extract_text()
-                    if not text:
-                        continue
-                    
-                    lines = text.split('\n')
-                    # If PNB is detected in the file name or first page, use PNBParser
-                    if ("pnb" in base_name.lower()) or ("punjab national bank" in text.lower()):
-                        logger.info("Detected PNB statement, using PNBParser.")
-                        transactions.extend(self.pnb_parser.parse_pnb_transactions(lines))
-                        continue
-                    i = 0
-                    
-                    while i < len(lines):
-                        line_content = lines[i].strip()
-                        if not line_content:
-                            i += 1
-                            continue
-
-                        if not transactions:
-                            currency, symbol = self._detect_currency(line_content)
-                            logger.info(f"Detected currency: {currency} ({symbol})")
-
-                        # Try SBI parser first
-                        transaction = self.sbi_parser.parse_multi_line_transaction(line_content, lines, i)
-                        
-                        if transaction:
-                            transactions.append(transaction)
-                            logger.debug(f"Found SBI transaction: {transaction}")
-                            # Skip next line for SBI multi-line format
-                            sbi_line1_pattern = self.config.sbi_patterns["line1"]
-                            if re.match(sbi_line1_pattern, line_content):
-                                i += 2
-                                continue
-                        else:
-                            # Try traditional SBI format
-                            transaction = self.sbi_parser.parse_traditional_format(line_content)
-                            if transaction:
-                                transactions.append(transaction)
-                                logger.debug(f"Found traditional SBI transaction: {transaction}")
-                            else:
-                                # Try universal parser
-                                transaction = self.universal_parser.parse_with_patterns(line_content, lines, i)
-                                if transaction:
-                                    transactions.append(transaction)
-                                    logger.debug(f"Found universal transaction: {transaction}")
-                                else:
-                                    # Try enhanced fallback parsing
-                                    transaction = self.universal_parser.enhanced_fallback_parsing(line_content, lines, i)
-                                    if transaction:
-                                        transactions.append(transaction)
-                                        logger.debug(f"Found fallback transaction: {transaction}")
-
-                        i += 1
+            pages = self._extract_pages_text(pdf_path)
+            currency, symbol = self._detect_currency(self._document_head(pages))
+            logger.info(f"Detected currency: {currency} ({symbol})")
+            
+            # Classify the statement once and pick its page parser
+            bank = self._classify_document(base_name, next((text for text in pages if text), ""))
+            if bank:
+                logger.info(f"Detected {bank} statement, using {bank} parser.")
+            parse_page = self._page_parsers[bank]
             
+            # Pages are independent once the bank is known; parse them concurrently
+            max_workers = max(1, min(MAX_PAGE_WORKERS, len(pages)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                page_results = executor.map(
+                    self._parse_page_text, range(1, len(pages) + 1), pages, repeat(parse_page)
+                )
+                for page_transactions in page_results:
+                    transactions.extend(page_transactions)
+        
             # Create DataFrame and apply comprehensive fixes
             if transactions:
-                df = pd.DataFrame(transactions)
+                df = self._build_dataframe(transactions, symbol)
                 logger.info(f"📊 Initial extraction: {len(df)} transactions")
                 
                 # Apply comprehensive data quality fixes
@@ -148,7 +233,7 @@ class CompleteBankExtractor:
                 validation_results = self._apply_comprehensive_validation(df, base_name)
                 
                 # Save final file
-                df.to_csv(final_csv, index=False)
+                self._write_csv(df, final_csv)
                 
                 # Save validation report
                 self._save_validation_report(validation_results, validation_report)
@@ -170,9 +255,6 @@ class CompleteBankExtractor:
         """Apply comprehensive data quality fixes."""
         logger.info("🔧 Applying comprehensive data quality fixes...")
         
-        # Standardize columns
-        df = self._standardize_columns(df, currency, symbol)
-        
         # Fix balance calculations
         df = self._fix_balance_calculations(df)
         
@@ -188,28 +270,100 @@ class CompleteBankExtractor:
         logger.info(f"📈 Data quality improvements completed: {len(df)} transactions")
         return df
     
-    def _standardize_columns(self, df: pd.DataFrame, currency: str, symbol: str) -> pd.DataFrame:
-        """Standardize column names and formats."""
-        # Ensure required columns exist
-        required_columns = [
-            'Transaction Date', 'Narrative', 
-            f'Amount ({symbol})', 'Balance'
-        ]
-        
-        # Initialize missing columns
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = None
-        
-        # Rename Amount column if it exists
-        if 'Amount' in df.columns:
-            df[f'Amount ({symbol})'] = df['Amount']
-            df = df.drop('Amount', axis=1)
-        
-        # Reorder columns
-        df = df[required_columns]
-        
-        return df
+    def _classify_document(self, base_name: str, first_page_text: str) -> Optional[str]:
+        """Detect the issuing bank from the file name and first page text."""
+        if "pnb" in base_name.lower():
+            return "PNB"
+        
+        first_page_text = first_page_text.lower()
+        for bank, marker in BANK_MARKERS:
+            if marker in first_page_text:
+                return bank
+        return None
+    
+    def _parse_page_text(self, page_num: int, text: str, parse_page: Callable[[List[str]], List[Dict]]) -> List[Dict]:
+        """Split one page into stripped lines and parse its transactions."""
+        logger.info(f"Processing page {page_num}")
+        if not text:
+            return []
+        
+        # Strip once and drop blank lines; parsers look ahead by index into this list
+        lines = [line for line in (raw.strip() for raw in text.splitlines()) if line]
+        return parse_page(lines)
+    
+    def _parse_page_lines(self, lines: List[str], fall_through: bool = True) -> List[Dict]:
+        """Parse the stripped lines of one page into transactions."""
+        transactions = []
+        skip_next = False
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Narrative stop flags are cached per page and shared by every multi-line narrative
+        boundaries = None
+        
+        for i, line_content in enumerate(lines):
+            if skip_next:
+                skip_next = False
+                continue
+            
+            # Every parser needs a leading digit and a decimal amount; skip the regexes otherwise
+            if not line_content[0].isdigit() or '.' not in line_content:
+                continue
+            
+            # Try SBI parser first
+            transaction = self.sbi_parser.parse_multi_line_transaction(line_content, lines, i)
+            if transaction:
+                transactions.append(transaction)
+                if debug:
+                    logger.debug("Found SBI transaction: %s", transaction)
+                # Skip next line for SBI multi-line format
+                skip_next = True
+                continue
+            
+            # Try traditional SBI format
+            transaction = self.sbi_parser.parse_traditional_format(line_content)
+            if transaction:
+                transactions.append(transaction)
+                if debug:
+                    logger.debug("Found traditional SBI transaction: %s", transaction)
+                continue
+            
+            # Statements known to be SBI stop here
+            if not fall_through:
+                continue
+            
+            if boundaries is None:
+                boundaries = self.universal_parser.narrative_boundaries(lines)
+            
+            # Try universal parser
+            transaction = self.universal_parser.parse_with_patterns(line_content, lines, i, boundaries)
+            if transaction:
+                transactions.append(transaction)
+                if debug:
+                    logger.debug("Found universal transaction: %s", transaction)
+                continue
+            
+            # Try enhanced fallback parsing
+            transaction = self.universal_parser.enhanced_fallback_parsing(line_content, lines, i, boundaries)
+            if transaction:
+                transactions.append(transaction)
+                if debug:
+                    logger.debug("Found fallback transaction: %s", transaction)
+        
+        return transactions
+    
+    def _build_dataframe(self, transactions: List[Dict], symbol: str) -> pd.DataFrame:
+        """Build the transactions DataFrame directly in the output column layout."""
+        import numpy as np
+        import pandas as pd
+        
+        # Gather each field into its own list (missing keys become None) so pandas
+        # builds whole columns instead of inferring the schema row by row
+        columns = {field: [t.get(field) for t in transactions] for field in TRANSACTION_FIELDS}
+        return pd.DataFrame({
+            'Transaction Date': columns['Transaction Date'],
+            'Narrative': columns['Narrative'],
+            f'Amount ({symbol})': np.array(columns['Amount'], dtype=np.float64),
+            'Balance': columns['Balance'],
+        })
     
     def _fix_balance_calculations(self, df: pd.DataFrame) -> pd.DataFrame:
         """Fix balance calculations - use extracted balance from PDF."""
@@ -222,34 +376,32 @@ class CompleteBankExtractor:
             return df
         
         # Fill missing narratives
-        df['Narrative'] = df['Narrative'].fillna('')
-        
-        # Clean narratives
-        df['Narrative'] = df['Narrative'].astype(str).apply(self._clean_narrative_text)
-        
-        # Remove very short narratives (likely parsing errors)
-        df = df[df['Narrative'].str.len() >= 3]
+        narratives = df['Narrative'].fillna('').astype(str)
+        narratives = narratives.mask(narratives == 'nan', '')
+        
+        # Clean narratives: collapse whitespace, drop leading numbers and
+        # keep only alphanumeric, spaces, hyphens, dots, slashes
+        narratives = (
+            narratives.str.strip()
+            .str.replace(NARR_WS_RE, ' ', regex=True)
+            .str.replace(NARR_LEAD_NUM_RE, '', regex=True)
+            .str.replace(NARR_CHARS_RE, '', regex=True)
+            .str.strip()
+        )
+        df['Narrative'] = narratives
         
         logger.info("📝 Cleaned narrative descriptions")
         return df
     
-    def _clean_narrative_text(self, text: str) -> str:
-        """Clean individual narrative text."""
-        if not text or text == 'nan':
-            return ''
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        # Remove common parsing artifacts
-        text = re.sub(r'^\d+\s*', '', text)  # Remove leading numbers
-        text = re.sub(r'[^\w\s\-\./]', '', text)  # Keep only alphanumeric, spaces, hyphens, dots, slashes
-        
-        return text.strip()
-    
     def _remove_suspicious_transactions(self, df: pd.DataFrame) -> pd.DataFrame:
         """Remove transactions that are likely parsing errors."""
+        import pandas as pd
+        
         initial_count = len(df)
+        rules = self.config.validation_rules
+        
+        # Very short narratives are likely parsing errors
+        mask = df['Narrative'].str.len() >= 3 if 'Narrative' in df.columns else pd.Series(True, index=df.index)
         
         # Get amount column
         amount_col = None
@@ -258,18 +410,18 @@ class CompleteBankExtractor:
                 amount_col = col
                 break
         
-        if amount_col is None:
-            return df
-        
-        # Remove transactions with very small amounts (likely parsing errors)
-        df = df[df[amount_col].abs() >= 1.0]
-        
-        # Remove transactions with extremely large amounts (likely parsing errors)
-        df = df[df[amount_col].abs() <= 1000000000]  # 1 billion
+        if amount_col is not None:
+            # Very small or extremely large amounts are likely parsing errors
+            mask &= df[amount_col].abs().between(
+                rules.get("min_amount", 1.0), rules.get("max_amount", 1000000000)
+            )
+            
+            # Remove transactions with missing dates
+            if 'Transaction Date' in df.columns:
+                mask &= df['Transaction Date'].notna()
         
-        # Remove transactions with missing dates
-        if 'Transaction Date' in df.columns:
-            df = df[df['Transaction Date'].notna()]
+        # Filter once instead of copying the frame per condition
+        df = df.loc[mask].reset_index(drop=True)
         
         final_count = len(df)
         if initial_count != final_count:
@@ -279,16 +431,39 @@ class CompleteBankExtractor:
     
     def _standardize_dates(self, df: pd.DataFrame) -> pd.DataFrame:
         """Standardize date formats."""
+        import pandas as pd
+        
         date_columns = ['Transaction Date']
         
         for col in date_columns:
             if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-                df[col] = df[col].dt.strftime('%Y-%m-%d')
+                # A statement only has a few hundred distinct dates: parse and format
+                # each once in one vectorised call, then map them back onto the rows
+                distinct = pd.Series(df[col].unique())
+                formatted = pd.to_datetime(distinct, errors='coerce').dt.strftime('%Y-%m-%d')
+                df[col] = df[col].map(pd.Series(formatted.to_numpy(), index=distinct))
         
         logger.info("📅 Standardized date formats")
         return df
     
+    def _write_csv(self, df: pd.DataFrame, csv_path: str):
+        """Write transactions to CSV, using pyarrow's multithreaded writer when available."""
+        pyarrow_csv = _pyarrow_csv()
+        if pyarrow_csv is not None:
+            pa, pa_csv = pyarrow_csv
+            try:
+                table = _float_columns_as_text(pa, pa.Table.from_pandas(df, preserve_index=False))
+                with open(csv_path, 'wb') as f:
+                    # Header as pandas writes it; pyarrow would quote every column name
+                    f.write(df.head(0).to_csv(index=False, lineterminator='\n').encode('utf-8'))
+                    # Cleaned narratives never contain delimiters or quotes
+                    pa_csv.write_csv(table, f, pa_csv.WriteOptions(include_header=False, quoting_style='none'))
+                return
+            except (pa.ArrowException, TypeError, ValueError) as e:
+                logger.debug(f"pyarrow CSV writer failed, using pandas: {e}")
+        
+        df.to_csv(csv_path, index=False, lineterminator='\n')
+    
     def _apply_comprehensive_validation(self, df: pd.DataFrame, file_name: str) -> Dict[str, Any]:
         """Apply comprehensive validation checks."""
         logger.info("🔍 Applying comprehensive validation...")
@@ -310,6 +485,9 @@ class CompleteBankExtractor:
         # 1. Data Integrity Checks
         validation_results["checks"]["data_integrity"] = self.validator.validate_data_integrity(df)
         
+        # Parse dates once for the remaining checks
+        df = self.validator.prepare(df)
+        
         # 2. Business Logic Validation
         validation_results["checks"]["business_logic"] = self.validator.validate_business_logic(df)
         
@@ -367,6 +545,15 @@ class CompleteBankExtractor:
                 for rec in validation_results["summary"]["recommendations"]:
                     f.write(f"• {rec}\n")
     
+    @staticmethod
+    def _record_result(results_by_path: Dict[str, str], pdf_path: str, result: Optional[str]):
+        """Keep the output of one processed PDF, logging whether it produced any"""
+        if result:
+            logger.info(f"📄 Processed: {os.path.basename(pdf_path)}")
+            results_by_path[pdf_path] = result
+        else:
+            logger.warning(f"⚠️ No output for: {os.path.basename(pdf_path)}")
+    
     def process_all_pdfs(self, data_dir: str = "data", output_dir: str = "output"):
         """Process all PDFs in the data directory."""
         if not os.path.exists(data_dir):
@@ -381,17 +568,32 @@ class CompleteBankExtractor:
         
         logger.info(f"🚀 Found {len(pdf_files)} PDF files to process")
         
-        results = []
-        for pdf_file in pdf_files:
-            pdf_path = os.path.join(data_dir, pdf_file)
-            logger.info(f"\n{'='*60}")
-            logger.info(f"📄 Processing: {pdf_file}")
-            logger.info(f"{'='*60}")
-            
-            # Extract and fix in one step
-            result = self.extract_and_fix_transactions(pdf_path, output_dir)
-            if result:
-                results.append(result)
+        pdf_paths = [os.path.join(data_dir, pdf_file) for pdf_file in pdf_files]
+        results_by_path = {}
+        
+        if len(pdf_paths) == 1:
+            # A pool would only add process start-up for a single statement
+            pdf_path = pdf_paths[0]
+            try:
+                self._record_result(results_by_path, pdf_path, self.extract_and_fix_transactions(pdf_path, output_dir))
+            except Exception as e:
+                logger.error(f"Error processing {pdf_path}: {e}")
+        else:
+            # Each PDF is independent, so extract and fix them in parallel
+            max_workers = min(len(pdf_paths), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_process_one, (pdf_path, output_dir, self.config_file)): pdf_path
+                    for pdf_path in pdf_paths
+                }
+                for future in as_completed(futures):
+                    pdf_path = futures[future]
+                    try:
+                        self._record_result(results_by_path, pdf_path, future.result())
+                    except Exception as e:
+                        logger.error(f"Error processing {pdf_path}: {e}")
+        
+        results = [results_by_path[p] for p in pdf_paths if p in results_by_path]
         
         logger.info(f"\n{'='*60}")
         logger.info(f"🎉 Successfully processed {len(results)} PDF files!")
@@ -6,36 +6,85 @@ Contains parsing logic for various transaction patterns.
 import re
 import logging
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from typing import Optional, Dict, List, Tuple
 
+from .config import BALANCE_RE, is_header_line
+
 logger = logging.getLogger(__name__)
 
+# Fixed line-level patterns, compiled once at import
+LAST_NUMERIC_RE = re.compile(r'[+-]?[0-9,]+\.\d{2}')
+BALANCE_TAIL_RE = re.compile(r'[0-9,]+\.\d{2}$')
+TX_NUMBER_RE = re.compile(r'^(\d+)')
+PNB_DATE_RE = re.compile(r'(\d{2}/\d{2}/\d{4})')
+PNB_AMOUNT_RE = re.compile(r'[\d,]+\.\d{2}')
+PNB_BALANCE_RE = re.compile(r'([\d,]+\.\d{2})\s*Cr\.')
+
+@lru_cache(maxsize=None)
+def _format_separators(fmt: str) -> frozenset:
+    """Non-alphanumeric literals of a strptime format (whitespace as ' ')"""
+    separators = set()
+    chars = iter(fmt)
+    for char in chars:
+        if char == '%':
+            if next(chars, None) == '%':
+                separators.add('%')
+        elif char.isspace():
+            separators.add(' ')
+        elif not char.isalnum():
+            separators.add(char)
+    return frozenset(separators)
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str, formats: Tuple[str, ...]) -> Optional[datetime]:
+    """Parse date_str with the first matching format; statements repeat the same dates"""
+    # strptime matches format literals exactly, so skip formats whose separators
+    # are missing from the string instead of letting them raise
+    separators = {' ' if char.isspace() else char for char in date_str if not char.isalnum()}
+    for fmt in formats:
+        if not _format_separators(fmt) <= separators:
+            continue
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+def _parse_amount(text: str) -> float:
+    """Convert an amount already isolated by a pattern group, e.g. '+1,234.56'"""
+    return float(text.replace(',', '') if ',' in text else text)
+
 class TransactionParser:
     """Base class for transaction parsing."""
     
     def __init__(self, config):
         self.config = config
+        # Config patterns are compiled once; use them directly instead of re's cache
+        self._date_res = config.compiled_date_patterns
+        self._amount_res = config.compiled_amount_patterns
+        self._transaction_res = config.compiled_transaction_patterns
+        self._any_date_re = config.any_date_re
+        self._date_alternation_re = config.date_alternation_re
+        self._any_amount_re = config.any_amount_re
+        self._sbi_line1_re = config.sbi_patterns["line1"]
+        self._sbi_line2_re = config.sbi_patterns["line2"]
+        self._sbi_traditional_re = config.sbi_patterns["traditional"]
+        self._date_formats = tuple(config.date_formats)
     
     def parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date string to datetime object."""
         try:
-            date_str = date_str.strip()
-            
-            for fmt in self.config.date_formats:
-                try:
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
-            
-            return None
+            return _parse_date_cached(date_str.strip(), self._date_formats)
         except Exception:
             return None
     
     def extract_amount(self, text: str) -> Optional[float]:
         """Extract amount from text."""
         try:
-            for pattern in self.config.amount_patterns:
-                matches = re.findall(pattern, text)
+            for pattern in self._amount_res:
+                matches = pattern.findall(text)
                 if matches:
                     # Take the last match (usually the amount)
                     amount_str = matches[-1].replace(',', '')
@@ -47,13 +96,29 @@ class TransactionParser:
     def extract_last_numeric_value(self, line: str) -> Optional[float]:
         """Extract the last numeric value from a line (usually balance)."""
         try:
-            matches = re.findall(r'[+-]?[0-9,]+\.\d{2}', line)
-            if matches:
-                return float(matches[-1].replace(',', ''))
-            return None
+            # Every amount has a decimal point; skip the scan on lines without one
+            if '.' not in line:
+                return None
+            matches = LAST_NUMERIC_RE.findall(line)
+            return _parse_amount(matches[-1]) if matches else None
         except Exception:
             return None
     
+    def _first_date_match(self, line: str) -> Optional[re.Match]:
+        """Leftmost match of the highest-priority date format found anywhere in line"""
+        # One fused scan finds the leftmost date and the format k that matched there.
+        # Higher-priority formats failed at that position and everywhere before it,
+        # so they only need searching after it; otherwise the fused match is the answer.
+        fused = self._date_alternation_re.search(line)
+        if fused is None:
+            return None
+        k = int(fused.lastgroup[1:])
+        for pattern in self._date_res[:k]:
+            match = pattern.search(line, fused.start() + 1)
+            if match:
+                return match
+        return fused
+    
     def _extract_narrative(self, line: str, date_matches: List) -> str:
         """Extract narrative from transaction line"""
         if len(date_matches) >= 1:
@@ -62,10 +127,10 @@ class TransactionParser:
             end_pos = len(line)
             
             # Find amount position
-            for pattern in self.config.amount_patterns:
-                amount_match = re.search(pattern, line[start_pos:])
+            for pattern in self._amount_res:
+                amount_match = pattern.search(line, start_pos)
                 if amount_match:
-                    end_pos = start_pos + amount_match.start()
+                    end_pos = amount_match.start()
                     break
             
             narrative = line[start_pos:end_pos].strip()
@@ -74,12 +139,15 @@ class TransactionParser:
     
     def _is_transaction_line(self, line: str) -> bool:
         """Strictly check if line is a real transaction (date, amount, balance present)"""
+        # Cheap rejects: too short for a date and balance, or no decimal point
+        if len(line) < 10 or '.' not in line:
+            return False
         # Must have a date, an amount, and a balance
-        has_date = any(re.search(pattern, line) for pattern in self.config.date_patterns)
-        has_amount = any(re.search(pattern, line) for pattern in self.config.amount_patterns)
-        has_balance = bool(re.search(r'[0-9,]+\.\d{2}(\s|$)', line))
+        has_date = bool(self._any_date_re.search(line))
+        has_amount = bool(self._any_amount_re.search(line))
+        has_balance = bool(BALANCE_RE.search(line))
         # Must not be a header or info row
-        is_not_header = not re.match(r'^(Account|Branch|CRN|IFSC|MICR|Elint|TRANSACTION|#|\s*$)', line, re.IGNORECASE)
+        is_not_header = not is_header_line(line)
         return has_date and has_amount and has_balance and is_not_header
 
 class SBIParser(TransactionParser):
@@ -87,23 +155,25 @@ class SBIParser(TransactionParser):
     
     def parse_multi_line_transaction(self, line: str, lines: List[str], line_index: int) -> Optional[Dict]:
         """Parse SBI multi-line transaction format."""
-        sbi_line1_pattern = self.config.sbi_patterns["line1"]
+        # SBI lines start with the transaction date
+        if not line[:1].isdigit():
+            return None
+        m1 = self._sbi_line1_re.match(line)
         
-        if re.match(sbi_line1_pattern, line):
-            logger.debug(f"SBI pattern matched for line: {line}")
+        if m1:
+            logger.debug("SBI pattern matched for line: %s", line)
             try:
-                m1 = re.match(sbi_line1_pattern, line)
                 transaction_date = self.parse_date(m1.group(1).replace('-', ' '))
                 transaction_type = m1.group(2)  # TO or BY
                 narration1 = m1.group(3).strip()
-                amount = float(m1.group(4).replace(',', ''))
-                balance = float(m1.group(5).replace(',', ''))
+                amount = _parse_amount(m1.group(4))
+                balance = _parse_amount(m1.group(5))
                 
                 # Look ahead for value date and more narration
                 narration2 = ''
                 if line_index + 1 < len(lines):
                     next_line = lines[line_index + 1].strip()
-                    m2 = re.match(self.config.sbi_patterns["line2"], next_line)
+                    m2 = self._sbi_line2_re.match(next_line)
                     if m2:
                         narration2 = m2.group(2).strip()
                 
@@ -119,14 +189,15 @@ class SBIParser(TransactionParser):
                     "Balance": balance
                 }
             except Exception as e:
-                logger.debug(f"SBI multi-line pattern failed: {e}")
+                logger.debug("SBI multi-line pattern failed: %s", e)
                 return None
         return None
     
     def parse_traditional_format(self, line: str) -> Optional[Dict]:
         """Parse traditional SBI format with separate debit/credit columns."""
-        sbi_pattern = self.config.sbi_patterns["traditional"]
-        sbi_match = re.match(sbi_pattern, line)
+        if not line[:1].isdigit():
+            return None
+        sbi_match = self._sbi_traditional_re.match(line)
         
         if sbi_match:
             try:
@@ -134,12 +205,12 @@ class SBIParser(TransactionParser):
                 narrative = sbi_match.group(3).strip()
                 debit = sbi_match.group(5)
                 credit = sbi_match.group(6)
-                balance = float(sbi_match.group(7).replace(',', ''))
+                balance = _parse_amount(sbi_match.group(7))
                 
                 if debit != '-':
-                    amount = -float(debit.replace(',', ''))
+                    amount = -_parse_amount(debit)
                 elif credit != '-':
-                    amount = float(credit.replace(',', ''))
+                    amount = _parse_amount(credit)
                 else:
                     amount = 0.0
                 
@@ -150,17 +221,21 @@ class SBIParser(TransactionParser):
                     "Balance": balance
                 }
             except Exception as e:
-                logger.debug(f"SBI traditional pattern failed: {e}")
+                logger.debug("SBI traditional pattern failed: %s", e)
                 return None
         return None
 
 class UniversalParser(TransactionParser):
     """Universal parser for various bank formats."""
     
-    def parse_with_patterns(self, line: str, lines: List[str], line_index: int) -> Optional[Dict]:
+    def parse_with_patterns(self, line: str, lines: List[str], line_index: int,
+                            boundaries: Optional[List[Optional[bool]]] = None) -> Optional[Dict]:
         """Parse transaction using universal patterns."""
-        for pattern_idx, pattern in enumerate(self.config.transaction_patterns):
-            match = re.match(pattern, line)
+        # Every universal pattern starts with a transaction number
+        if not line[:1].isdigit():
+            return None
+        for pattern_idx in self.config.transaction_candidates(line):
+            match = self._transaction_res[pattern_idx].match(line)
             if match:
                 try:
                     groups = match.groups()
@@ -169,19 +244,20 @@ class UniversalParser(TransactionParser):
                         transaction_date = self.parse_date(groups[2])
                         narrative = groups[3].strip() if len(groups) > 3 else ""
                         if len(narrative) < 10 or narrative.upper().endswith('-'):
-                            narrative = self._extract_multi_line_narrative(lines, line_index, narrative)
-                        amount = self.extract_amount(groups[-2])
-                        balance = self.extract_last_numeric_value(line)
+                            narrative = self._extract_multi_line_narrative(lines, line_index, narrative, boundaries)
+                        # Amount and balance groups hold exactly one amount each
+                        amount = _parse_amount(groups[-2])
+                        balance = _parse_amount(groups[-1])
                         
                     elif pattern_idx in [4, 5]:  # Patterns with debit/credit
                         transaction_date = self.parse_date(groups[1])
                         narrative = groups[2].strip()
                         if len(narrative) < 10 or narrative.upper().endswith('-'):
-                            narrative = self._extract_multi_line_narrative(lines, line_index, narrative)
-                        debit_amount = self.extract_amount(groups[4]) if len(groups) > 4 else None
-                        credit_amount = self.extract_amount(groups[5]) if len(groups) > 5 else None
+                            narrative = self._extract_multi_line_narrative(lines, line_index, narrative, boundaries)
+                        debit_amount = _parse_amount(groups[4]) if len(groups) > 4 else None
+                        credit_amount = _parse_amount(groups[5]) if len(groups) > 5 else None
                         amount = -debit_amount if debit_amount and debit_amount > 0 else (credit_amount if credit_amount and credit_amount > 0 else None)
-                        balance = self.extract_last_numeric_value(line)
+                        balance = _parse_amount(groups[-1])
                         
                     else:  # Fallback patterns
                         transaction_date = None
@@ -197,7 +273,7 @@ class UniversalParser(TransactionParser):
                             "Balance": balance
                         }
                 except Exception as e:
-                    logger.debug(f"Pattern {pattern_idx} failed: {e}")
+                    logger.debug("Pattern %s failed: %s", pattern_idx, e)
                     continue
         return None
     
@@ -205,47 +281,50 @@ class UniversalParser(TransactionParser):
         """Parse transaction using enhanced patterns (same as parse_with_patterns for compatibility)."""
         return self.parse_with_patterns(line, lines, line_index)
     
-    def _extract_multi_line_narrative(self, lines: List[str], line_index: int, initial_narrative: str) -> str:
+    def _is_narrative_boundary(self, line: str) -> bool:
+        """Check if a line ends a multi-line narrative (a new transaction or a balance line)"""
+        line = line.strip()
+        # A balance-like tail implies one of the amount patterns matches too
+        return self._is_transaction_line(line) or bool(BALANCE_TAIL_RE.search(line))
+    
+    def narrative_boundaries(self, lines: List[str]) -> List[Optional[bool]]:
+        """Per-page cache of narrative boundary flags, filled in as lines are first probed"""
+        return [None] * len(lines)
+    
+    def _extract_multi_line_narrative(self, lines: List[str], line_index: int, initial_narrative: str,
+                                      boundaries: Optional[List[Optional[bool]]] = None) -> str:
         """Extract multi-line narrative with improved logic."""
-        narrative = initial_narrative
-        j = line_index + 1
-        
-        while j < len(lines):
-            next_line = lines[j].strip()
-            
-            # Stop if next line is a new transaction
-            if self._is_transaction_line(next_line):
-                break
-            
-            # Stop if line contains amount and looks like balance
-            for pattern in self.config.amount_patterns:
-                if re.search(pattern, next_line):
-                    # Check if this looks like a balance line
-                    if re.search(r'[0-9,]+\.\d{2}$', next_line):
-                        break
+        parts = [initial_narrative]
+        # Stream the following lines of the page; the walk usually stops within a few
+        for j, next_line in enumerate(islice(lines, line_index + 1, None), line_index + 1):
+            # Stop at a new transaction or a line that looks like a balance; each
+            # line is checked at most once per page when a boundary cache is given
+            if boundaries is None:
+                is_boundary = self._is_narrative_boundary(next_line)
             else:
-                narrative += " " + next_line
-                j += 1
-                continue
-            break
+                is_boundary = boundaries[j]
+                if is_boundary is None:
+                    is_boundary = boundaries[j] = self._is_narrative_boundary(next_line)
+            if is_boundary:
+                break
+            parts.append(next_line.strip())
         
-        return narrative.strip()
+        return " ".join(parts).strip()
     
-    def enhanced_fallback_parsing(self, line: str, lines: List[str], line_index: int) -> Optional[Dict]:
+    def enhanced_fallback_parsing(self, line: str, lines: List[str], line_index: int,
+                                  boundaries: Optional[List[Optional[bool]]] = None) -> Optional[Dict]:
         """Enhanced fallback parsing for complex formats, always use last numeric value as balance"""
         try:
-            tx_match = re.match(r'^(\d+)', line)
+            tx_match = line[:1].isdigit() and TX_NUMBER_RE.match(line)
             if not tx_match:
                 return None
-            date_matches = []
-            for pattern in self.config.date_patterns:
-                date_matches.extend(list(re.finditer(pattern, line)))
-            if len(date_matches) >= 1:
-                transaction_date = self.parse_date(date_matches[0].group())
+            date_match = self._first_date_match(line)
+            if date_match:
+                transaction_date = self.parse_date(date_match.group())
                 if transaction_date:
-                    narrative = self._extract_narrative(line, date_matches)
+                    narrative = self._extract_narrative(line, [date_match])
                     if len(narrative) < 10 or narrative.upper().endswith('-'):
-                        narrative = self._extract_multi_line_narrative(lines, line_index, narrative)
+                        narrative = self._extract_multi_line_narrative(lines, line_index, narrative, boundaries)
                     amount = self.extract_amount(line)
                     balance = self.extract_last_numeric_value(line)
                     if amount is not None and balance is not None:
@@ -256,39 +335,33 @@ class UniversalParser(TransactionParser):
                             "Balance": balance
                         }
         except Exception as e:
-            logger.debug(f"Enhanced fallback parsing failed: {e}")
+            logger.debug("Enhanced fallback parsing failed: %s", e)
         return None
 
 class PNBParser(TransactionParser):
     """Parser for Punjab National Bank statements with multi-line narration."""
     def parse_pnb_transactions(self, lines: list) -> list:
-        import re
-        transactions = []
-        current_narration = []
-        for line in lines:
-            line = line.strip()
-            # Check for date at the start of the line
-            date_match = re.match(r'(\d{2}/\d{2}/\d{4})', line)
-            if date_match:
-                # If we have a previous narration, attach it to the last transaction
-                if current_narration and transactions:
-                    transactions[-1]['Narration'] += ' ' + ' '.join(current_narration)
-                    current_narration = []
-                # Extract amounts and balance
-                amounts = re.findall(r'[\d,]+\.\d{2}', line)
-                balance_match = re.search(r'([\d,]+\.\d{2})\s*Cr\.', line)
-                # Build transaction dict
-                transactions.append({
-                    'Date': date_match.group(1),
-                    'Withdrawal': amounts[0] if len(amounts) > 0 else '',
-                    'Deposit': amounts[1] if len(amounts) > 1 else '',
-                    'Balance': balance_match.group(1) if balance_match else '',
-                    'Narration': ''
-                })
-            else:
-                # If not a date line, treat as narration
-                current_narration.append(line)
-        # Attach any remaining narration
-        if current_narration and transactions:
-            transactions[-1]['Narration'] += ' ' + ' '.join(current_narration)
-        return transactions 
\ No newline at end of file
+        import pandas as pd
+        
+        if not lines:
+            return []
+        s = pd.Series(lines, dtype=object).str.strip()
+        # Each date line starts a transaction; following lines are its narration
+        is_date = s.str.match(PNB_DATE_RE)
+        if not is_date.any():
+            return []
+        # Lines before the first date belong to the first transaction
+        tx_idx = is_date.cumsum().clip(lower=1)
+        
+        date_lines = s[is_date]
+        amounts = date_lines.str.findall(PNB_AMOUNT_RE)
+        narrations = s[~is_date].groupby(tx_idx[~is_date]).agg(' '.join)
+        transactions = pd.DataFrame({
+            'Date': date_lines.str.extract(PNB_DATE_RE, expand=False),
+            'Withdrawal': amounts.str[0].fillna(''),
+            'Deposit': amounts.str[1].fillna(''),
+            'Balance': date_lines.str.extract(PNB_BALANCE_RE, expand=False).fillna(''),
+        })
+        transactions.index = tx_idx[is_date].to_numpy()
+        transactions['Narration'] = (' ' + narrations).reindex(transactions.index, fill_value='')
+        return transactions.to_dict('records')
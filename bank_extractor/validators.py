@@ -3,18 +3,43 @@ Validators module for data validation and quality checks.
 """
 
 import logging
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _arrow_string_dtype() -> Optional[str]:
+    """Arrow-backed string dtype when pyarrow is installed, else None."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    return "string[pyarrow]"
+
 class DataValidator:
     """Data validation and quality checking."""
     
     def __init__(self, config):
         self.config = config
     
+    def prepare(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return df with parsed dates and Arrow narratives, converting at most once."""
+        columns = {}
+        if 'Transaction Date' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['Transaction Date']):
+            columns['Transaction Date'] = pd.to_datetime(df['Transaction Date'], errors='coerce')
+        # Arrow string kernels run str.len/str.contains without boxing each cell
+        string_dtype = _arrow_string_dtype()
+        if string_dtype and 'Narrative' in df.columns and df['Narrative'].dtype == object:
+            columns['Narrative'] = df['Narrative'].astype(string_dtype)
+        if columns:
+            # assign copies, so the caller's frame keeps its original columns
+            df = df.assign(**columns)
+        return df
+    
     def validate_data_integrity(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Validate data integrity."""
         results = {
@@ -25,14 +50,11 @@ class DataValidator:
         }
         
         # Check for missing values
-        for col in df.columns:
-            missing_count = df[col].isna().sum()
-            if missing_count > 0:
-                results["missing_values"][col] = missing_count
+        missing = df.isna().sum()
+        results["missing_values"] = missing[missing > 0].astype(int).to_dict()
         
         # Check data types
-        for col in df.columns:
-            results["data_types"][col] = str(df[col].dtype)
+        results["data_types"] = df.dtypes.astype(str).to_dict()
         
         return results
     
@@ -46,7 +68,7 @@ class DataValidator:
         
         # Date range validation
         if 'Transaction Date' in df.columns:
-            df['Transaction Date'] = pd.to_datetime(df['Transaction Date'])
+            df = self.prepare(df)
             results["date_range"]["start"] = df['Transaction Date'].min().strftime('%Y-%m-%d')
             results["date_range"]["end"] = df['Transaction Date'].max().strftime('%Y-%m-%d')
             results["date_range"]["span_days"] = (df['Transaction Date'].max() - df['Transaction Date'].min()).days
@@ -56,7 +78,7 @@ class DataValidator:
             daily_counts = df['Transaction Date'].value_counts()
             results["transaction_frequency"]["max_daily"] = daily_counts.max()
             results["transaction_frequency"]["avg_daily"] = daily_counts.mean()
-            results["transaction_frequency"]["high_frequency_days"] = len(daily_counts[daily_counts > 20])
+            results["transaction_frequency"]["high_frequency_days"] = int((daily_counts.to_numpy() > 20).sum())
         
         return results
     
@@ -76,25 +98,33 @@ class DataValidator:
                 break
         
         if amount_col:
-            amounts = df[amount_col]
-            results["amount_stats"]["total_debits"] = len(amounts[amounts < 0])
-            results["amount_stats"]["total_credits"] = len(amounts[amounts > 0])
-            results["amount_stats"]["total_debit_amount"] = amounts[amounts < 0].sum()
-            results["amount_stats"]["total_credit_amount"] = amounts[amounts > 0].sum()
-            results["amount_stats"]["net_amount"] = amounts.sum()
+            # One sign mask per direction over the non-null amounts; pandas reductions skip NaN too
+            amounts = df[amount_col].to_numpy(dtype=np.float64, na_value=np.nan)
+            amounts = amounts[~np.isnan(amounts)]
+            debits = amounts[amounts < 0]
+            credits = amounts[amounts > 0]
+            results["amount_stats"]["total_debits"] = len(debits)
+            results["amount_stats"]["total_credits"] = len(credits)
+            results["amount_stats"]["total_debit_amount"] = float(debits.sum())
+            results["amount_stats"]["total_credit_amount"] = float(credits.sum())
+            results["amount_stats"]["net_amount"] = float(amounts.sum())
             
-            results["amount_range"]["min"] = amounts.min()
-            results["amount_range"]["max"] = amounts.max()
-            results["amount_range"]["mean"] = amounts.mean()
-            results["amount_range"]["median"] = amounts.median()
+            if len(amounts):
+                results["amount_range"]["min"] = float(amounts.min())
+                results["amount_range"]["max"] = float(amounts.max())
+                results["amount_range"]["mean"] = float(amounts.mean())
+                results["amount_range"]["median"] = float(np.median(amounts))
+            else:
+                results["amount_range"] = {"min": np.nan, "max": np.nan, "mean": np.nan, "median": np.nan}
             
             # Check for suspicious amounts
-            for pattern in self.config.validation_rules["suspicious_patterns"]:
-                suspicious = df[df['Narrative'].str.contains(pattern, case=False, na=False)]
-                if len(suspicious) > 0:
+            matcher = self.config.suspicious_matcher
+            counts = matcher.count(df['Narrative'])
+            for pattern, count in zip(matcher.patterns, counts):
+                if count > 0:
                     results["suspicious_amounts"].append({
                         "pattern": pattern,
-                        "count": len(suspicious)
+                        "count": count
                     })
         
         return results
@@ -108,7 +138,7 @@ class DataValidator:
         }
         
         if 'Transaction Date' in df.columns:
-            df['Transaction Date'] = pd.to_datetime(df['Transaction Date'], errors='coerce')
+            df = self.prepare(df)
             
             # Check for future dates
             future_dates = df[df['Transaction Date'] > datetime.now()]
@@ -133,13 +163,15 @@ class DataValidator:
         
         if 'Narrative' in df.columns:
             narratives = df['Narrative']
-            results["narrative_stats"]["avg_length"] = narratives.str.len().mean()
-            results["narrative_stats"]["min_length"] = narratives.str.len().min()
-            results["narrative_stats"]["max_length"] = narratives.str.len().max()
+            lengths = narratives.str.len()
+            results["narrative_stats"]["avg_length"] = lengths.mean()
+            results["narrative_stats"]["min_length"] = lengths.min()
+            results["narrative_stats"]["max_length"] = lengths.max()
             
-            results["empty_narratives"] = len(narratives[narratives == ''])
-            results["short_narratives"] = len(narratives[narratives.str.len() < 5])
-            results["duplicate_narratives"] = len(narratives) - len(narratives.unique())
+            results["empty_narratives"] = int((lengths == 0).sum())
+            results["short_narratives"] = int((lengths < 5).sum())
+            # unique() counted NaN as a value, so keep it in the count
+            results["duplicate_narratives"] = len(narratives) - narratives.nunique(dropna=False)
         
         return results
     
@@ -152,17 +184,15 @@ class DataValidator:
         }
         
         if 'Balance' in df.columns:
-            balances = df['Balance']
-            results["negative_balances"] = len(balances[balances < 0])
+            values = df['Balance'].to_numpy(dtype=np.float64, na_value=np.nan)
+            results["negative_balances"] = int(np.count_nonzero(values < 0))
             
-            # Check for balance consistency
-            if len(balances) > 1:
-                for i in range(1, len(balances)):
-                    if pd.notna(balances.iloc[i-1]) and pd.notna(balances.iloc[i]):
-                        # Balance should be cumulative
-                        if balances.iloc[i] < balances.iloc[i-1] and balances.iloc[i] >= 0:
-                            results["balance_consistency"] = False
-                            results["balance_issues"].append(f"Balance inconsistency at row {i+1}")
+            # Check for balance consistency: a balance should not drop to a smaller non-negative value
+            prev, curr = values[:-1], values[1:]
+            bad = (curr < prev) & (curr >= 0) & ~np.isnan(prev) & ~np.isnan(curr)
+            issue_rows = np.flatnonzero(bad) + 2
+            results["balance_issues"] = [f"Balance inconsistency at row {row}" for row in issue_rows.tolist()]
+            results["balance_consistency"] = not bad.any()
         
         return results
     
@@ -174,35 +204,35 @@ class DataValidator:
             "transaction_patterns": {}
         }
         
-        if 'Transaction Date' in df.columns:
-            df['Transaction Date'] = pd.to_datetime(df['Transaction Date'])
+        # Amount column is named after the detected currency
+        amount_col = None
+        for col in df.columns:
+            if 'Amount' in col:
+                amount_col = col
+                break
+        
+        df = self.prepare(df)
+        if 'Transaction Date' in df.columns and amount_col:
             
             # Monthly summary - fix tuple key issue
             monthly_stats = df.groupby(df['Transaction Date'].dt.to_period('M')).agg({
                 'Transaction Date': 'count',
-                'Amount (₹)': ['sum', 'mean', 'min', 'max']
+                amount_col: ['sum', 'mean', 'min', 'max']
             }).round(2)
             
-            # Convert to proper dictionary format
-            monthly_dict = {}
-            for month in monthly_stats.index:
-                month_str = str(month)
-                monthly_dict[month_str] = {
-                    'transaction_count': int(monthly_stats.loc[month, ('Transaction Date', 'count')]),
-                    'total_amount': float(monthly_stats.loc[month, ('Amount (₹)', 'sum')]),
-                    'avg_amount': float(monthly_stats.loc[month, ('Amount (₹)', 'mean')]),
-                    'min_amount': float(monthly_stats.loc[month, ('Amount (₹)', 'min')]),
-                    'max_amount': float(monthly_stats.loc[month, ('Amount (₹)', 'max')])
-                }
-            results["monthly_summary"] = monthly_dict
+            # Convert to proper dictionary format in one pass
+            monthly_stats.columns = ['transaction_count', 'total_amount', 'avg_amount', 'min_amount', 'max_amount']
+            monthly_stats.index = monthly_stats.index.astype(str)
+            monthly_stats = monthly_stats.astype({
+                'transaction_count': 'int64',
+                'total_amount': 'float64',
+                'avg_amount': 'float64',
+                'min_amount': 'float64',
+                'max_amount': 'float64'
+            })
+            results["monthly_summary"] = monthly_stats.to_dict('index')
         
         # Top transactions by amount
-        amount_col = None
-        for col in df.columns:
-            if 'Amount' in col:
-                amount_col = col
-                break
-        
         if amount_col:
             top_debits = df.nlargest(5, amount_col)[['Transaction Date', 'Narrative', amount_col]]
             top_credits = df.nsmallest(5, amount_col)[['Transaction Date', 'Narrative', amount_col]]
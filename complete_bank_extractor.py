@@ -1,29 +1,282 @@
 import pdfplumber
+import numpy as np
 import pandas as pd
 import re
 from datetime import datetime, timedelta
+import io
 import os
 import json
 from typing import List, Dict, Any, Optional, Tuple
 import logging
-from collections import defaultdict
+import multiprocessing
+from collections import defaultdict, namedtuple
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+
+# PyMuPDF is a C binding and extracts text much faster than pdfplumber
+try:
+    import pymupdf as fitz
+except ImportError:
+    try:
+        import fitz
+    except ImportError:
+        fitz = None
+
+# orjson encodes the report sections several times faster than the stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Aho-Corasick finds every literal suspicious pattern in one pass over a narrative
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Formats tried by _parse_date, in order
+PARSE_DATE_FORMATS = (
+    '%d %b %Y', '%d %b %y', '%d-%b-%Y', '%d-%b-%y',
+    '%d/%m/%Y', '%d/%m/%y', '%Y-%m-%d', '%d-%m-%Y', '%d %b %y', '%d-%b-%y'
+)
+
+# Separator literals of each format (whitespace as ' '). strptime needs every literal
+# of a format to be present, so formats whose separators a string lacks are skipped
+_PARSE_DATE_SEPARATORS = tuple(
+    (fmt, frozenset(' ' if char.isspace() else char for char in re.sub(r'%.', '', fmt) if not char.isalnum()))
+    for fmt in dict.fromkeys(PARSE_DATE_FORMATS)
+)
+
+# Set to "pdfplumber" to skip PyMuPDF (e.g. where its AGPL license is a concern)
+PDF_BACKEND_ENV = "BANK_EXTRACTOR_PDF_BACKEND"
+
+# Parsed transactions are plain tuples; the DataFrame gets its column names once
+Tx = namedtuple('Tx', 'date narrative amount balance')
+TRANSACTION_COLUMNS = ['Transaction Date', 'Narrative', 'Amount', 'Balance']
+
+@dataclass
+class _Counters:
+    """Issue counts tallied while the validation checks are recorded"""
+    errors: int = 0
+    warnings: int = 0
+
+    def add(self, check_results: Any):
+        """Count the errors and warnings a check reports"""
+        if isinstance(check_results, dict):
+            self.errors += len(check_results.get("errors", ()))
+            self.warnings += len(check_results.get("warnings", ()))
+
+# Pages handed to each text-extraction worker process
+PAGES_PER_WORKER = 8
+
+@lru_cache(maxsize=None)
+def _arrow_string_dtype() -> Optional[str]:
+    """Arrow-backed string dtype when pyarrow is installed, else None"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    return "string[pyarrow]"
+
+@lru_cache(maxsize=None)
+def _pyarrow_csv() -> Optional[Tuple[Any, Any]]:
+    """Import pyarrow and its CSV module on first use, or None if unavailable"""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return None
+    return pa, pa_csv
+
+def _arrow_formats_like_repr(values: np.ndarray) -> bool:
+    """Whether Arrow's float-to-string cast gives repr() for every value, ignoring NaN"""
+    # Below 1e-4 and from 1e10 up Arrow and repr() switch to exponents differently
+    magnitude = np.abs(values[~np.isnan(values)])
+    return bool(np.all((magnitude == 0) | ((magnitude >= 1e-4) & (magnitude < 1e10))))
+
+def _columns_as_pandas_text(pa: Any, table: Any) -> Any:
+    """Convert float and timestamp columns so pyarrow writes them as pandas' to_csv does"""
+    import pyarrow.compute as pc
+    
+    for i, field in enumerate(table.schema):
+        if pa.types.is_floating(field.type):
+            column = table.column(i)
+            if not _arrow_formats_like_repr(column.to_numpy()):
+                raise ValueError(f"{field.name} has values Arrow formats unlike pandas")
+            # Arrow drops the ".0" of whole numbers
+            text = pc.cast(column, pa.string())
+            whole = pc.match_substring_regex(text, r'^-?\d+$')
+            text = pc.if_else(whole, pc.binary_join_element_wise(text, '.0', ''), text)
+            table = table.set_column(i, field.name, text)
+        elif pa.types.is_timestamp(field.type):
+            # pandas writes timestamps as plain dates when all of them are at midnight;
+            # anything else is left to the pandas writer
+            column = table.column(i)
+            if not pc.all(pc.equal(pc.floor_temporal(column, unit="day"), column)).as_py():
+                raise ValueError(f"{field.name} has times of day")
+            table = table.set_column(i, field.name, pc.cast(column, pa.date32()))
+    return table
+
+# Datetimes and dataclasses are handed to _json_default so they come out as str() does
+ORJSON_REPORT_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+                         if orjson is not None else 0)
+
+# orjson writes NaN and infinities as null, and floats below 1e-4 or from 1e16 up
+# unlike repr(); sections that may hold such values are left to json
+ORJSON_MISMATCH_RE = re.compile(r'null|\d[eE]|0\.0000')
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback matching json.dumps(default=str): float64 is a float subclass json writes as a number"""
+    if isinstance(obj, np.float64):
+        return float(obj)
+    return str(obj)
+
+def _dumps_report_section(obj: Any) -> str:
+    """Indented JSON for one report section, the same text whether or not orjson is used"""
+    if orjson is not None:
+        try:
+            text = orjson.dumps(obj, default=_json_default, option=ORJSON_REPORT_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            # e.g. non-string keys or integers beyond 64 bits, which json handles its own way
+            text = None
+        if text is not None and not ORJSON_MISMATCH_RE.search(text):
+            return text
+    # Keep ₹ and other non-ASCII text readable instead of \uXXXX-escaped
+    return json.dumps(obj, indent=2, default=str, ensure_ascii=False)
+
+# A regex that matches only itself once its backslash escapes are removed, e.g. 0\.01
+_LITERAL_PATTERN_RE = re.compile(r'(?:[^\\.^$*+?{}\[\]|()]|\\[^A-Za-z0-9])+')
+
+def _suspicious_automaton(patterns: Tuple[str, ...]) -> Any:
+    """Aho-Corasick automaton over the lowercased patterns, or None if any pattern needs re"""
+    if ahocorasick is None or not patterns:
+        return None
+    literals = []
+    for pattern in patterns:
+        # Lowercasing agrees with re.IGNORECASE only for ASCII literals
+        if not (pattern.isascii() and _LITERAL_PATTERN_RE.fullmatch(pattern)):
+            return None
+        literals.append(re.sub(r'\\(.)', r'\1', pattern).lower())
+    automaton = ahocorasick.Automaton()
+    for i, literal in enumerate(literals):
+        # Patterns that unescape to the same literal share one key
+        automaton.add_word(literal, automaton.get(literal, ()) + (i,))
+    automaton.make_automaton()
+    return automaton
+
+def _use_pymupdf() -> bool:
+    """PyMuPDF is used for text extraction when installed, unless disabled"""
+    return fitz is not None and os.environ.get(PDF_BACKEND_ENV, "").lower() != "pdfplumber"
+
+def _count_pages(pdf_path: str) -> int:
+    """Number of pages in a PDF"""
+    if _use_pymupdf():
+        with fitz.open(pdf_path) as doc:
+            return doc.page_count
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+def _pymupdf_page_lines(page: Any) -> List[str]:
+    """Text lines of a PyMuPDF page, block by block rather than via one page string"""
+    # Each text block ends in '\n', which is stripped so that no blank entry sits between
+    # blocks for the SBI next-line look-ahead to land on. The result is get_text("text")
+    # .split('\n') without its trailing empty entry; image blocks (type 1) are skipped.
+    return [
+        line
+        for block in page.get_text("blocks")
+        if block[6] == 0
+        for line in block[4].rstrip('\n').split('\n')
+    ]
+
+def _extract_page_range(args: Tuple[str, int, int]) -> List[List[str]]:
+    """Extract the text lines of pages [start, stop) of a PDF (also runs in worker processes)"""
+    pdf_path, start, stop = args
+    if _use_pymupdf():
+        with fitz.open(pdf_path) as doc:
+            return [_pymupdf_page_lines(doc.load_page(i)) for i in range(start, stop)]
+    with pdfplumber.open(pdf_path) as pdf:
+        return [pdf.pages[i].extract_text().split('\n') for i in range(start, stop)]
+
+def _top_k_positions(values: np.ndarray, k: int, largest: bool) -> np.ndarray:
+    """Positions of the k largest/smallest non-NaN values, ordered as nlargest/nsmallest do"""
+    positions = np.flatnonzero(~np.isnan(values))
+    keys = -values[positions] if largest else values[positions]
+    if len(keys) > k:
+        # O(n) selection; keep every tie of the k-th key so the earliest rows can win
+        kth = np.partition(keys, k - 1)[k - 1]
+        keep = keys <= kth
+        positions, keys = positions[keep], keys[keep]
+    # By key, then by row order (keep='first'); like pandas, NaN rows fill any shortfall
+    top = positions[np.lexsort((positions, keys))[:k]]
+    if len(top) < k:
+        top = np.concatenate([top, np.flatnonzero(np.isnan(values))[:k - len(top)]])
+    return top
+
+def _process_one(args: Tuple[str, str, Optional[str]]) -> str:
+    """Process a single PDF of a batch in a worker process"""
+    pdf_path, output_dir, config_file = args
+    # The batch already spreads PDFs over the CPUs: extract this one's pages in-process
+    return CompleteBankExtractor(config_file, page_workers=1)._process_pdf(pdf_path, output_dir)
+
 class CompleteBankExtractor:
     """
     Complete Bank Statement Extractor with comprehensive validation
     """
     
-    def __init__(self, config_file: str = None):
-        """Initialize the extractor with enhanced configuration"""
+    def __init__(self, config_file: str = None, page_workers: Optional[int] = None):
+        """Initialize the extractor with enhanced configuration
+        
+        page_workers caps the processes that extract one long PDF (default: one per CPU).
+        """
+        self.config_file = config_file
+        self.page_workers = page_workers
         self.config = self._load_config(config_file)
         self.date_patterns = self._get_date_patterns()
         self.amount_patterns = self._get_amount_patterns()
         self.validation_results = {}
         
+        # Compile every pattern once; the per-line methods call these directly
+        self._date_res = tuple(re.compile(p) for p in self.date_patterns)
+        self._amount_res = tuple(re.compile(p) for p in self.amount_patterns)
+        self._tx_res = tuple(re.compile(p) for p in self.config["transaction_patterns"])
+        # Fused alternations for existence checks; the named-group date variant also
+        # tells which format matched, so priority order can still be honoured
+        self._any_date_re = self._join_patterns(self.date_patterns)
+        self._any_amount_re = self._join_patterns(self.amount_patterns)
+        self._date_alternation_re = self._join_patterns(self.date_patterns, named=True)
+        # Transaction patterns are wrapped in one numbered group each: match.lastindex
+        # is the wrapper of the pattern that matched, its own groups follow it
+        self._all_tx_re = self._join_patterns(self.config["transaction_patterns"], capture=True)
+        self._tx_branches = {}
+        group = 1
+        for pattern_idx, pattern in enumerate(self._tx_res):
+            self._tx_branches[group] = pattern_idx
+            group += pattern.groups + 1
+        self._suspicious_patterns = tuple(self.config["validation_rules"]["suspicious_patterns"])
+        self._suspicious_res = [re.compile(p, re.IGNORECASE) for p in self._suspicious_patterns]
+        self._suspicious_ac = _suspicious_automaton(self._suspicious_patterns)
+        self._currency_res = [
+            (currency, info["symbol"], [re.compile(p) for p in info["patterns"]])
+            for currency, info in self.config["currencies"].items()
+        ]
+        self._sbi1_re = re.compile(r'^(\d{2}-\w{3}-\d{2,4})\s+(TO|BY)\s+(.+?)\s+([0-9,]+\.\d{2})\s+([+-]?[0-9,]+\.\d{2})$')
+        self._sbi2_re = re.compile(r'^\((\d{2}-\w{3}-\d{2,4})\)\s*(.*)$')
+        self._sbi_traditional_re = re.compile(r'^(\d{2}-\w{3}-\d{2,4})\s*\((\d{2}-\w{3}-\d{2,4})\)\s+(.+?)\s+([\w/-]+)\s+([0-9,]+\.\d{2}|-)\s+([0-9,]+\.\d{2}|-)\s+([+-]?[0-9,]+\.\d{2})$')
+        self._balance_tail_re = re.compile(r'[0-9,]+\.\d{2}(\s|$)')
+        self._balance_end_re = re.compile(r'[0-9,]+\.\d{2}$')
+        self._header_re = re.compile(r'^(Account|Branch|CRN|IFSC|MICR|Elint|TRANSACTION|#|\s*$)', re.IGNORECASE)
+        self._last_numeric_re = re.compile(r'[+-]?[0-9,]+\.\d{2}')
+        self._tx_prefix_re = re.compile(r'^(\d+)')
+        self._digits_re = re.compile(r'[+-]?[0-9,]+')
+        self._ws_re = re.compile(r'\s+')
+        self._leadnum_re = re.compile(r'^\d+\s*')
+        self._nonword_re = re.compile(r'[^\w\s\-\./]')
+        
     def _load_config(self, config_file: str) -> Dict[str, Any]:
         """Load enhanced bank-specific configuration"""
         default_config = {
@@ -102,6 +355,17 @@ class CompleteBankExtractor:
                 patterns.append(r'\d{2}-\d{2}-\d{2}')
         return patterns
     
+    @staticmethod
+    def _join_patterns(patterns: List[str], named: bool = False, capture: bool = False) -> re.Pattern:
+        """Compile patterns into one alternation (never matches if there are none)"""
+        if not patterns:
+            return re.compile(r'(?!)')
+        if named:
+            return re.compile("|".join(f"(?P<d{i}>{p})" for i, p in enumerate(patterns)))
+        if capture:
+            return re.compile("|".join(f"({p})" for p in patterns))
+        return re.compile("|".join(f"(?:{p})" for p in patterns))
+    
     def _get_amount_patterns(self) -> List[str]:
         """Generate regex patterns for different amount formats"""
         return [
@@ -113,38 +377,39 @@ class CompleteBankExtractor:
     
     def _detect_currency(self, text: str) -> Tuple[str, str]:
         """Detect currency from text"""
-        for currency, info in self.config["currencies"].items():
-            for pattern in info["patterns"]:
-                if re.search(pattern, text):
-                    return currency, info["symbol"]
+        for currency, symbol, patterns in self._currency_res:
+            for pattern in patterns:
+                if pattern.search(text):
+                    return currency, symbol
         return "INR", "₹"  # Default to INR
     
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _parse_date_cached(date_str: str) -> Optional[datetime]:
+        """Parse a stripped date string; statements repeat the same few dates"""
+        separators = {' ' if char.isspace() else char for char in date_str if not char.isalnum()}
+        # Repeated formats in PARSE_DATE_FORMATS could never succeed the second time
+        for fmt, needed in _PARSE_DATE_SEPARATORS:
+            if not needed <= separators:
+                continue
+            try:
+                return datetime.strptime(date_str, fmt)
+            except ValueError:
+                continue
+        return None
+    
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date string to datetime object"""
         try:
-            # Handle various date formats
-            date_formats = [
-                '%d %b %Y', '%d %b %y', '%d-%b-%Y', '%d-%b-%y',
-                '%d/%m/%Y', '%d/%m/%y', '%Y-%m-%d', '%d-%m-%Y', '%d %b %y', '%d-%b-%y'
-            ]
-            
             # Clean the date string
-            date_str = date_str.strip()
-            
-            for fmt in date_formats:
-                try:
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
-            
-            return None
+            return self._parse_date_cached(date_str.strip())
         except Exception:
             return None
     
     def _extract_amount(self, text: str) -> Optional[float]:
         """Extract amount from text"""
-        for pattern in self.amount_patterns:
-            match = re.search(pattern, text)
+        for pattern in self._amount_res:
+            match = pattern.search(text)
             if match:
                 try:
                     amount_str = match.group(0).replace(',', '')
@@ -155,13 +420,32 @@ class CompleteBankExtractor:
     
     def _is_transaction_line(self, line: str) -> bool:
         """Strictly check if line is a real transaction (date, amount, balance present)"""
-        # Must have a date, an amount, and a balance
-        has_date = any(re.search(pattern, line) for pattern in self.date_patterns)
-        has_amount = any(re.search(pattern, line) for pattern in self.amount_patterns)
-        has_balance = bool(re.search(r'[0-9,]+\.\d{2}(\s|$)', line))
-        # Must not be a header or info row
-        is_not_header = not re.match(r'^(Account|Branch|CRN|IFSC|MICR|Elint|TRANSACTION|#|\s*$)', line, re.IGNORECASE)
-        return has_date and has_amount and has_balance and is_not_header
+        # Cheap rejects: too short for a date and balance, or no decimal point
+        if len(line) < 10 or '.' not in line:
+            return False
+        # Must have a balance, must not be a header or info row, and must have
+        # a date and an amount; cheapest checks first, each stops at the first miss
+        return bool(
+            self._balance_tail_re.search(line)
+            and not self._header_re.match(line)
+            and self._any_date_re.search(line)
+            and self._any_amount_re.search(line)
+        )
+    
+    def _first_date_match(self, line: str) -> Optional[re.Match]:
+        """First match of the highest-priority date format found anywhere in line"""
+        # The fused scan finds the leftmost date and the format k that matched there.
+        # Higher-priority formats failed at that position and before it, so they only
+        # need searching after it; otherwise the fused match is format k's first match.
+        fused = self._date_alternation_re.search(line)
+        if fused is None:
+            return None
+        k = int(fused.lastgroup[1:])
+        for pattern in self._date_res[:k]:
+            match = pattern.search(line, fused.start() + 1)
+            if match:
+                return match
+        return fused
     
     def _extract_narrative(self, line: str, date_matches: List) -> str:
         """Extract narrative from transaction line"""
@@ -170,12 +454,12 @@ class CompleteBankExtractor:
             start_pos = date_matches[0].end()
             end_pos = len(line)
             
-            # Find amount position
-            for pattern in self.amount_patterns:
-                amount_match = re.search(pattern, line[start_pos:])
-                if amount_match:
-                    end_pos = start_pos + amount_match.start()
-                    break
+            # Find amount position: the first amount pattern that matches. The
+            # comma-free variants only match where the pattern before them does,
+            # so a decimal amount, else any digit run, decides it
+            amount_match = self._last_numeric_re.search(line, start_pos) or self._digits_re.search(line, start_pos)
+            if amount_match:
+                end_pos = amount_match.start()
             
             narrative = line[start_pos:end_pos].strip()
             return narrative
@@ -198,46 +482,45 @@ class CompleteBankExtractor:
         logger.info(f"🔄 Extracting and fixing transactions from {pdf_path}")
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    logger.info(f"Processing page {page_num + 1}")
-                    text = page.extract_text()
-                    lines = text.split('\n')
-                    
-                    i = 0
-                    while i < len(lines):
-                        line_content = lines[i].strip()
-                        if not line_content:
-                            i += 1
-                            continue
-
-                        if not transactions:
-                            currency, symbol = self._detect_currency(line_content)
-                            logger.info(f"Detected currency: {currency} ({symbol})")
-
-                        # Try to parse with enhanced patterns
-                        transaction = self._parse_with_enhanced_patterns(line_content, lines, i)
-
-                        if transaction:
-                            transactions.append(transaction)
-                            logger.debug(f"Found transaction with enhanced patterns: {transaction}")
-                            # If SBI multi-line, skip the next line
-                            sbi_line1_pattern = r'^(\d{2}-\w{3}-\d{2,4})\s+(TO|BY)\s+(.+?)\s+([0-9,]+\.\d{2})\s+([+-]?[0-9,]+\.\d{2})$'
-                            if re.match(sbi_line1_pattern, line_content):
-                                i += 2
-                                continue
-                        else:
-                            # Fallback parsing
-                            transaction = self._enhanced_fallback_parsing(line_content, lines, i)
-                            if transaction:
-                                transactions.append(transaction)
-                                logger.debug(f"Found transaction with fallback: {transaction}")
+            for page_num, lines in enumerate(self._extract_pages_lines(pdf_path)):
+                logger.info(f"Processing page {page_num + 1}")
+                
+                # Every parser needs a leading digit and a decimal amount: find the
+                # candidate lines in one vectorized pass and parse only those
+                stripped = pd.Series(lines, dtype=object).str.strip()
+                candidates = stripped.str.match(self._tx_prefix_re) & stripped.str.contains('.', regex=False)
+                
+                skip_until = 0
+                for i in candidates.to_numpy().nonzero()[0].tolist():
+                    if i < skip_until:
+                        continue
+                    line_content = stripped.iat[i]
 
-                        i += 1
-            
+                    # Try to parse with enhanced patterns
+                    parsed = self._parse_with_enhanced_patterns(line_content, lines, i)
+                    source = "enhanced patterns"
+                    if parsed:
+                        # SBI multi-line transactions also consume the next line
+                        transaction, consumed = parsed
+                        skip_until = i + consumed
+                    else:
+                        # Fallback parsing
+                        transaction = self._enhanced_fallback_parsing(line_content, lines, i)
+                        source = "fallback"
+                    if not transaction:
+                        continue
+                    
+                    # Currency comes from the line that yields the first transaction,
+                    # so it is detected once per statement
+                    if not transactions:
+                        currency, symbol = self._detect_currency(line_content)
+                        logger.info(f"Detected currency: {currency} ({symbol})")
+                    transactions.append(transaction)
+                    logger.debug(f"Found transaction with {source}: {transaction}")
+        
             # Create DataFrame and apply comprehensive fixes
             if transactions:
-                df = pd.DataFrame(transactions)
+                df = pd.DataFrame(transactions, columns=TRANSACTION_COLUMNS)
                 logger.info(f"📊 Initial extraction: {len(df)} transactions")
                 
                 # Apply comprehensive data quality fixes
@@ -247,7 +530,7 @@ class CompleteBankExtractor:
                 validation_results = self._apply_comprehensive_validation(df, base_name)
                 
                 # Save final file
-                df.to_csv(final_csv, index=False)
+                self._write_csv(df, final_csv)
                 
                 # Save validation report
                 self._save_validation_report(validation_results, validation_report)
@@ -265,59 +548,69 @@ class CompleteBankExtractor:
             logger.error(f"Error processing PDF: {e}")
             return ""
     
-    def _parse_with_enhanced_patterns(self, line: str, lines: List[str], line_index: int) -> Optional[Dict]:
-        """Parse transaction using enhanced patterns, including SBI multi-line format"""
+    def _extract_pages_lines(self, pdf_path: str) -> List[List[str]]:
+        """Extract the text lines of every page, in page order, using worker processes for long PDFs"""
+        page_count = _count_pages(pdf_path)
+        workers = self.page_workers or os.cpu_count() or 1
+        # Inside a pool worker (e.g. one PDF of a batch) a nested pool would oversubscribe the CPUs
+        if multiprocessing.parent_process() is not None:
+            workers = 1
+        # Short statements: process start-up would cost more than it saves
+        if page_count <= PAGES_PER_WORKER or workers <= 1:
+            return _extract_page_range((pdf_path, 0, page_count))
+        
+        # Each worker opens the PDF once and extracts a contiguous range of pages
+        ranges = [
+            (pdf_path, start, min(start + PAGES_PER_WORKER, page_count))
+            for start in range(0, page_count, PAGES_PER_WORKER)
+        ]
+        with ProcessPoolExecutor(max_workers=min(len(ranges), workers)) as executor:
+            return [page for pages in executor.map(_extract_page_range, ranges) for page in pages]
+    
+    def _parse_with_enhanced_patterns(self, line: str, lines: List[str], line_index: int) -> Optional[Tuple[Tx, int]]:
+        """Parse transaction using enhanced patterns, including SBI multi-line format
+        
+        Returns the transaction and the number of lines it consumed, or None.
+        """
         # SBI multi-line: line, then (value date) and more narration on next line
         # Example:
         # 06-Sep-24 TO TRANSFER TRANSFER TO 4897695 430.00 -427.92
         # (06-Sep-2024) UPI/DR/425032698980/VIKASH 162091
-        sbi_line1_pattern = r'^(\d{2}-\w{3}-\d{2,4})\s+(TO|BY)\s+(.+?)\s+([0-9,]+\.\d{2})\s+([+-]?[0-9,]+\.\d{2})$'
-        if re.match(sbi_line1_pattern, line):
+        m1 = self._sbi1_re.match(line)
+        if m1:
             logger.debug(f"SBI pattern matched for line: {line}")
             try:
-                m1 = re.match(sbi_line1_pattern, line)
                 transaction_date = self._parse_date(m1.group(1).replace('-', ' '))
                 transaction_type = m1.group(2)  # TO or BY
                 narration1 = m1.group(3).strip()
                 amount = float(m1.group(4).replace(',', ''))
                 balance = float(m1.group(5).replace(',', ''))
                 
-                # Look ahead for value date and more narration
-                value_date = None
+                # Look ahead for more narration after the (value date); the
+                # value date itself is not part of the output, so it is not parsed
                 narration2 = ''
                 if line_index + 1 < len(lines):
                     next_line = lines[line_index + 1].strip()
-                    m2 = re.match(r'^\((\d{2}-\w{3}-\d{2,4})\)\s*(.*)$', next_line)
+                    m2 = self._sbi2_re.match(next_line)
                     if m2:
-                        value_date = self._parse_date(m2.group(1).replace('-', ' '))
                         narration2 = m2.group(2).strip()
                 
-                # If value_date not found, fallback to transaction_date
-                if not value_date:
-                    value_date = transaction_date
-                
                 # Combine narrations
                 narrative = f"{transaction_type} {narration1}"
                 if narration2:
                     narrative += f" {narration2}"
                 
-                return {
-                    "Transaction Date": transaction_date,
-                    "Narrative": narrative,
-                    "Amount": amount,
-                    "Balance": balance
-                }
+                # The value-date line belongs to this transaction
+                return Tx(transaction_date, narrative, amount, balance), 2
             except Exception as e:
                 logger.debug(f"SBI multi-line pattern failed: {e}")
                 return None
         # Fallback to previous logic
         # SBI pattern: Date (Value Date) | Narration | Ref/Cheque | Debit | Credit | Balance
-        sbi_pattern = r'^(\d{2}-\w{3}-\d{2,4})\s*\((\d{2}-\w{3}-\d{2,4})\)\s+(.+?)\s+([\w/-]+)\s+([0-9,]+\.\d{2}|-)\s+([0-9,]+\.\d{2}|-)\s+([+-]?[0-9,]+\.\d{2})$'
-        sbi_match = re.match(sbi_pattern, line)
+        sbi_match = self._sbi_traditional_re.match(line)
         if sbi_match:
             try:
                 transaction_date = self._parse_date(sbi_match.group(1).replace('-', ' '))
-                value_date = self._parse_date(sbi_match.group(2).replace('-', ' '))
                 narrative = sbi_match.group(3).strip()
                 debit = sbi_match.group(5)
                 credit = sbi_match.group(6)
@@ -328,114 +621,109 @@ class CompleteBankExtractor:
                     amount = float(credit.replace(',', ''))
                 else:
                     amount = 0.0
-                return {
-                    "Transaction Date": transaction_date,
-                    "Narrative": narrative,
-                    "Amount": amount,
-                    "Balance": balance
-                }
+                return Tx(transaction_date, narrative, amount, balance), 1
             except Exception as e:
                 logger.debug(f"SBI pattern failed: {e}")
                 return None
-        # Fallback to existing patterns
-        for pattern_idx, pattern in enumerate(self.config["transaction_patterns"]):
-            match = re.match(pattern, line)
-            if match:
-                try:
-                    groups = match.groups()
-                    if pattern_idx in [0, 1, 2]:
-                        value_date = self._parse_date(groups[1])
-                        transaction_date = self._parse_date(groups[2])
-                        narrative = groups[3].strip() if len(groups) > 3 else ""
-                        if len(narrative) < 10 or narrative.upper().endswith('-'):
-                            narrative = self._extract_multi_line_narrative(lines, line_index, narrative)
-                        amount = self._extract_amount(groups[-2])
-                        balance = self._extract_last_numeric_value(line)
-                    elif pattern_idx in [4, 5]:
-                        transaction_date = self._parse_date(groups[1])
-                        value_date = transaction_date
-                        narrative = groups[2].strip()
-                        if len(narrative) < 10 or narrative.upper().endswith('-'):
-                            narrative = self._extract_multi_line_narrative(lines, line_index, narrative)
-                        debit_amount = self._extract_amount(groups[4]) if len(groups) > 4 else None
-                        credit_amount = self._extract_amount(groups[5]) if len(groups) > 5 else None
-                        amount = -debit_amount if debit_amount and debit_amount > 0 else (credit_amount if credit_amount and credit_amount > 0 else None)
-                        balance = self._extract_last_numeric_value(line)
-                    else:
-                        transaction_date = None
-                        value_date = None
-                        narrative = ""
-                        amount = self._extract_amount(line)
-                        balance = self._extract_last_numeric_value(line)
-                    if amount is not None and transaction_date and balance is not None:
-                        return {
-                            "Transaction Date": transaction_date,
-                            "Narrative": narrative,
-                            "Amount": amount,
-                            "Balance": balance
-                        }
-                except Exception as e:
-                    logger.debug(f"Pattern {pattern_idx} failed: {e}")
-                    continue
+        # Fallback to existing patterns: one anchored match tries them all in order
+        match = self._all_tx_re.match(line)
+        if match:
+            first_idx = self._tx_branches[match.lastindex]
+            groups = match.groups()[match.lastindex:match.lastindex + self._tx_res[first_idx].groups]
+            transaction = self._transaction_from_groups(first_idx, groups, line, lines, line_index)
+            if transaction:
+                return transaction, 1
+            # The first matching pattern gave nothing usable; later ones still get their turn
+            for pattern_idx in range(first_idx + 1, len(self._tx_res)):
+                match = self._tx_res[pattern_idx].match(line)
+                if match:
+                    transaction = self._transaction_from_groups(pattern_idx, match.groups(), line, lines, line_index)
+                    if transaction:
+                        return transaction, 1
+        return None
+    
+    def _transaction_from_groups(self, pattern_idx: int, groups: Tuple, line: str, lines: List[str], line_index: int) -> Optional[Tx]:
+        """Build a transaction from the groups of one of the configured transaction patterns"""
+        try:
+            if pattern_idx in [0, 1, 2]:
+                transaction_date = self._parse_date(groups[2])
+                narrative = groups[3].strip() if len(groups) > 3 else ""
+                if len(narrative) < 10 or narrative.upper().endswith('-'):
+                    narrative = self._extract_multi_line_narrative(lines, line_index, narrative)
+                amount = self._extract_amount(groups[-2])
+                # The last group is the trailing balance, i.e. the line's last amount
+                balance = float(groups[-1].replace(',', ''))
+            elif pattern_idx in [4, 5]:
+                transaction_date = self._parse_date(groups[1])
+                narrative = groups[2].strip()
+                if len(narrative) < 10 or narrative.upper().endswith('-'):
+                    narrative = self._extract_multi_line_narrative(lines, line_index, narrative)
+                debit_amount = self._extract_amount(groups[4]) if len(groups) > 4 else None
+                credit_amount = self._extract_amount(groups[5]) if len(groups) > 5 else None
+                amount = -debit_amount if debit_amount and debit_amount > 0 else (credit_amount if credit_amount and credit_amount > 0 else None)
+                balance = float(groups[-1].replace(',', ''))
+            else:
+                transaction_date = None
+                narrative = ""
+                amount = self._extract_amount(line)
+                balance = self._extract_last_numeric_value(line)
+            if amount is not None and transaction_date and balance is not None:
+                return Tx(transaction_date, narrative, amount, balance)
+        except Exception as e:
+            logger.debug(f"Pattern {pattern_idx} failed: {e}")
         return None
     
     def _extract_multi_line_narrative(self, lines: List[str], line_index: int, initial_narrative: str) -> str:
         """Extract multi-line narrative with improved logic"""
-        narrative = initial_narrative
-        j = line_index + 1
+        parts = [initial_narrative]
         
-        while j < len(lines):
+        for j in range(line_index + 1, len(lines)):
             next_line = lines[j].strip()
             
             # Stop if next line is a new transaction
             if self._is_transaction_line(next_line):
                 break
             
-            # Stop if line contains amount and looks like balance
-            for pattern in self.amount_patterns:
-                if re.search(pattern, next_line):
-                    # Check if this looks like a balance line
-                    if re.search(r'[0-9,]+\.\d{2}$', next_line):
-                        break
-            else:
-                narrative += " " + next_line
-                j += 1
-                continue
-            break
+            # Stop if line ends in an amount, i.e. looks like a balance line
+            # (such a line always contains one of the amount patterns too)
+            if self._balance_end_re.search(next_line):
+                break
+            parts.append(next_line)
         
-        return narrative.strip()
+        return " ".join(parts).strip()
     
-    def _enhanced_fallback_parsing(self, line: str, lines: List[str], line_index: int) -> Optional[Dict]:
+    def _enhanced_fallback_parsing(self, line: str, lines: List[str], line_index: int) -> Optional[Tx]:
         """Enhanced fallback parsing for complex formats, always use last numeric value as balance"""
         try:
-            tx_match = re.match(r'^(\d+)', line)
+            tx_match = self._tx_prefix_re.match(line)
             if not tx_match:
                 return None
-            date_matches = []
-            for pattern in self.date_patterns:
-                date_matches.extend(list(re.finditer(pattern, line)))
-            if len(date_matches) >= 1:
-                transaction_date = self._parse_date(date_matches[0].group())
+            # One scan for the decimal amounts: the first is the amount (the first amount
+            # pattern wins whenever one exists) and the last is the balance
+            numbers = self._last_numeric_re.findall(line)
+            if not numbers:
+                return None
+            # Only the first date is used: the earliest match of the highest-priority format
+            date_match = self._first_date_match(line)
+            if date_match:
+                transaction_date = self._parse_date(date_match.group())
                 if transaction_date:
-                    narrative = self._extract_narrative(line, date_matches)
+                    narrative = self._extract_narrative(line, [date_match])
                     if len(narrative) < 10 or narrative.upper().endswith('-'):
                         narrative = self._extract_multi_line_narrative(lines, line_index, narrative)
-                    amount = self._extract_amount(line)
-                    balance = self._extract_last_numeric_value(line)
-                    if amount is not None and balance is not None:
-                        return {
-                            "Transaction Date": transaction_date,
-                            "Narrative": narrative,
-                            "Amount": amount,
-                            "Balance": balance
-                        }
+                    return Tx(
+                        transaction_date,
+                        narrative,
+                        float(numbers[0].replace(',', '')),
+                        float(numbers[-1].replace(',', ''))
+                    )
         except Exception as e:
             logger.debug(f"Enhanced fallback parsing failed: {e}")
         return None
     
     def _extract_last_numeric_value(self, line: str) -> Optional[float]:
         """Extract the last numeric value (balance) from a line"""
-        matches = re.findall(r'[+-]?[0-9,]+\.\d{2}', line)
+        matches = self._last_numeric_re.findall(line)
         if matches:
             try:
                 return float(matches[-1].replace(',', ''))
@@ -443,6 +731,24 @@ class CompleteBankExtractor:
                 return None
         return None
     
+    def _write_csv(self, df: pd.DataFrame, csv_path: str):
+        """Write transactions to CSV, using pyarrow's multithreaded writer when available"""
+        pyarrow_csv = _pyarrow_csv()
+        if pyarrow_csv is not None:
+            pa, pa_csv = pyarrow_csv
+            try:
+                table = _columns_as_pandas_text(pa, pa.Table.from_pandas(df, preserve_index=False))
+                with open(csv_path, 'wb') as f:
+                    # Header as pandas writes it; pyarrow would quote every column name
+                    f.write(df.head(0).to_csv(index=False, lineterminator='\n').encode('utf-8'))
+                    # Cleaned narratives never contain delimiters or quotes
+                    pa_csv.write_csv(table, f, pa_csv.WriteOptions(include_header=False, quoting_style='none'))
+                return
+            except (pa.ArrowException, TypeError, ValueError) as e:
+                logger.debug(f"pyarrow CSV writer failed, using pandas: {e}")
+        
+        df.to_csv(csv_path, index=False, lineterminator='\n')
+    
     def _apply_comprehensive_fixes(self, df: pd.DataFrame, currency: str, symbol: str) -> pd.DataFrame:
         """Apply comprehensive data quality fixes"""
         logger.info("🔧 Applying comprehensive data quality fixes...")
@@ -500,41 +806,38 @@ class CompleteBankExtractor:
             return df
         
         # Fill missing narratives
-        df['Narrative'] = df['Narrative'].fillna('')
-        
-        # Clean narratives
-        df['Narrative'] = df['Narrative'].astype(str).apply(self._clean_narrative_text)
+        narratives = df['Narrative'].fillna('').astype(str)
+        narratives = narratives.mask(narratives == 'nan', '')
+        
+        # Clean narratives in one vectorized pass: collapse whitespace, drop leading
+        # numbers and keep only alphanumeric, spaces, hyphens, dots, slashes
+        narratives = (
+            narratives.str.strip()
+            .str.replace(self._ws_re, ' ', regex=True)
+            .str.replace(self._leadnum_re, '', regex=True)
+            .str.replace(self._nonword_re, '', regex=True)
+            .str.strip()
+        )
+        # The replacements above stay on Python re (Arrow's RE2 kernels have ASCII-only
+        # \s and \w); the cleaned column is Arrow-backed so the length checks and
+        # validation string scans below run in Arrow compute kernels
+        string_dtype = _arrow_string_dtype()
+        if string_dtype:
+            narratives = narratives.astype(string_dtype)
+        df['Narrative'] = narratives
         
         # Remove very short narratives (likely parsing errors)
-        df = df[df['Narrative'].str.len() >= 3]
+        df = df[narratives.str.len() >= 3]
         
         logger.info("📝 Cleaned narrative descriptions")
         return df
     
-    def _clean_narrative_text(self, text: str) -> str:
-        """Clean individual narrative text"""
-        if not text or text == 'nan':
-            return ''
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        # Remove common parsing artifacts
-        text = re.sub(r'^\d+\s*', '', text)  # Remove leading numbers
-        text = re.sub(r'[^\w\s\-\./]', '', text)  # Keep only alphanumeric, spaces, hyphens, dots, slashes
-        
-        return text.strip()
-    
     def _remove_suspicious_transactions(self, df: pd.DataFrame) -> pd.DataFrame:
         """Remove transactions that are likely parsing errors"""
         initial_count = len(df)
         
         # Get amount column
-        amount_col = None
-        for col in df.columns:
-            if 'Amount' in col:
-                amount_col = col
-                break
+        amount_col = self._find_amount_column(df)
         
         if amount_col is None:
             return df
@@ -567,13 +870,29 @@ class CompleteBankExtractor:
         logger.info("📅 Standardized date formats")
         return df
     
+    @staticmethod
+    def _parse_transaction_dates(df: pd.DataFrame):
+        """Convert Transaction Date to datetimes in place, unless it already is"""
+        if not pd.api.types.is_datetime64_any_dtype(df['Transaction Date']):
+            # _standardize_dates leaves ISO strings, which the exact format parses fastest
+            df['Transaction Date'] = pd.to_datetime(
+                df['Transaction Date'], errors='coerce', format='%Y-%m-%d', cache=True
+            )
+    
+    @staticmethod
+    def _find_amount_column(df: pd.DataFrame) -> Optional[str]:
+        """Name of the amount column, which carries the currency symbol"""
+        return next((col for col in df.columns if 'Amount' in col), None)
+    
     def _apply_comprehensive_validation(self, df: pd.DataFrame, file_name: str) -> Dict[str, Any]:
         """Apply comprehensive validation checks"""
         logger.info("🔍 Applying comprehensive validation...")
         
+        # One clock read per run, shared by the report timestamp and the future-date check
+        now = datetime.now()
         validation_results = {
             "file_name": file_name,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
             "total_transactions": len(df),
             "checks": {},
             "warnings": [],
@@ -585,29 +904,41 @@ class CompleteBankExtractor:
             validation_results["errors"].append("No transactions found in file")
             return validation_results
         
-        # 1. Data Integrity Checks
-        validation_results["checks"]["data_integrity"] = self._validate_data_integrity(df)
+        # Looked up once and shared by the amount checks and the statistics
+        amount_col = self._find_amount_column(df)
         
-        # 2. Business Logic Validation
-        validation_results["checks"]["business_logic"] = self._validate_business_logic(df)
+        checks = validation_results["checks"]
+        counters = _Counters()
         
-        # 3. Amount Validation
-        validation_results["checks"]["amount_validation"] = self._validate_amounts(df)
+        # 1. Data Integrity Checks
+        checks["data_integrity"] = self._validate_data_integrity(df)
+        counters.add(checks["data_integrity"])
         
-        # 4. Date Validation
-        validation_results["checks"]["date_validation"] = self._validate_dates(df)
+        # Parsed once, after the integrity check has recorded the extracted dtypes;
+        # the date checks below then find datetimes already
+        if 'Transaction Date' in df.columns:
+            self._parse_transaction_dates(df)
+        # _clean_narratives normally stores Arrow strings already; frames built
+        # elsewhere get the same Arrow kernels for the narrative checks
+        string_dtype = _arrow_string_dtype()
+        if string_dtype and 'Narrative' in df.columns and df['Narrative'].dtype == object:
+            df['Narrative'] = df['Narrative'].astype(string_dtype)
         
-        # 5. Narrative Validation
-        validation_results["checks"]["narrative_validation"] = self._validate_narratives(df)
+        # 2. Business Logic Validation
+        checks["business_logic"] = self._validate_business_logic(df)
+        counters.add(checks["business_logic"])
         
-        # 6. Balance Validation
-        validation_results["checks"]["balance_validation"] = self._validate_balances(df)
+        # 3-6. Amount, Date, Narrative and Balance Validation in one pass
+        for check_name, check_results in self._validate_all(df, amount_col, now).items():
+            checks[check_name] = check_results
+            counters.add(check_results)
         
         # 7. Statistical Analysis
-        validation_results["checks"]["statistics"] = self._generate_statistics(df)
+        checks["statistics"] = self._generate_statistics(df, amount_col)
+        counters.add(checks["statistics"])
         
-        # Generate summary
-        validation_results["summary"] = self._generate_validation_summary(validation_results)
+        # Generate summary from the counts tallied above
+        validation_results["summary"] = self._generate_validation_summary(validation_results, counters)
         
         logger.info("✅ Validation completed")
         return validation_results
@@ -643,10 +974,11 @@ class CompleteBankExtractor:
         
         # Date range validation
         if 'Transaction Date' in df.columns:
-            df['Transaction Date'] = pd.to_datetime(df['Transaction Date'])
-            results["date_range"]["start"] = df['Transaction Date'].min().strftime('%Y-%m-%d')
-            results["date_range"]["end"] = df['Transaction Date'].max().strftime('%Y-%m-%d')
-            results["date_range"]["span_days"] = (df['Transaction Date'].max() - df['Transaction Date'].min()).days
+            self._parse_transaction_dates(df)
+            start, end = df['Transaction Date'].min(), df['Transaction Date'].max()
+            results["date_range"]["start"] = start.strftime('%Y-%m-%d')
+            results["date_range"]["end"] = end.strftime('%Y-%m-%d')
+            results["date_range"]["span_days"] = (end - start).days
         
         # Transaction frequency
         if 'Transaction Date' in df.columns:
@@ -657,7 +989,40 @@ class CompleteBankExtractor:
         
         return results
     
-    def _validate_amounts(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _validate_all(self, df: pd.DataFrame, amount_col: Optional[str] = None,
+                      now: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
+        """Amount, date, narrative and balance checks, sharing the columns they all read"""
+        if amount_col is None:
+            amount_col = self._find_amount_column(df)
+        # Narrative feeds both the suspicious-pattern scan and the narrative stats
+        narratives = df['Narrative'] if 'Narrative' in df.columns else None
+        return {
+            "amount_validation": self._validate_amounts(df, amount_col, narratives),
+            "date_validation": self._validate_dates(df, now),
+            "narrative_validation": self._validate_narratives(df, narratives),
+            "balance_validation": self._validate_balances(df),
+        }
+    
+    def _count_suspicious(self, narratives: pd.Series) -> List[int]:
+        """Number of narratives containing each suspicious pattern, ignoring case"""
+        if self._suspicious_ac is None:
+            return [int(narratives.str.contains(p, case=False, na=False).sum()) for p in self._suspicious_patterns]
+        counts = [0] * len(self._suspicious_patterns)
+        for narrative in narratives.tolist():
+            if not isinstance(narrative, str):
+                continue
+            if narrative.isascii():
+                # A pattern counts once per narrative, however often it occurs
+                found = {i for _, indices in self._suspicious_ac.iter(narrative.lower()) for i in indices}
+            else:
+                # re.IGNORECASE also matches some non-ASCII letters, e.g. 'ſ' for 's'
+                found = [i for i, regex in enumerate(self._suspicious_res) if regex.search(narrative)]
+            for i in found:
+                counts[i] += 1
+        return counts
+    
+    def _validate_amounts(self, df: pd.DataFrame, amount_col: Optional[str] = None,
+                          narratives: Optional[pd.Series] = None) -> Dict[str, Any]:
         """Validate transaction amounts"""
         results = {
             "amount_stats": {},
@@ -665,38 +1030,42 @@ class CompleteBankExtractor:
             "amount_range": {}
         }
         
+        # An empty frame has nothing to measure: report the defaults
+        if not len(df):
+            return results
+        
         # Get amount column
-        amount_col = None
-        for col in df.columns:
-            if 'Amount' in col:
-                amount_col = col
-                break
+        if amount_col is None:
+            amount_col = self._find_amount_column(df)
         
         if amount_col:
             amounts = df[amount_col]
-            results["amount_stats"]["total_debits"] = len(amounts[amounts < 0])
-            results["amount_stats"]["total_credits"] = len(amounts[amounts > 0])
-            results["amount_stats"]["total_debit_amount"] = amounts[amounts < 0].sum()
-            results["amount_stats"]["total_credit_amount"] = amounts[amounts > 0].sum()
+            # One sign mask per direction, reused for the counts and the sums
+            debits = amounts[amounts < 0]
+            credits = amounts[amounts > 0]
+            results["amount_stats"]["total_debits"] = len(debits)
+            results["amount_stats"]["total_credits"] = len(credits)
+            results["amount_stats"]["total_debit_amount"] = debits.sum()
+            results["amount_stats"]["total_credit_amount"] = credits.sum()
             results["amount_stats"]["net_amount"] = amounts.sum()
             
-            results["amount_range"]["min"] = amounts.min()
-            results["amount_range"]["max"] = amounts.max()
-            results["amount_range"]["mean"] = amounts.mean()
-            results["amount_range"]["median"] = amounts.median()
+            summary = amounts.agg(['min', 'max', 'mean', 'median'])
+            results["amount_range"] = summary.to_dict()
             
             # Check for suspicious amounts
-            for pattern in self.config["validation_rules"]["suspicious_patterns"]:
-                suspicious = df[df['Narrative'].str.contains(pattern, case=False, na=False)]
-                if len(suspicious) > 0:
-                    results["suspicious_amounts"].append({
-                        "pattern": pattern,
-                        "count": len(suspicious)
-                    })
+            patterns = self._suspicious_patterns
+            if patterns:
+                counts = self._count_suspicious(narratives if narratives is not None else df['Narrative'])
+                for pattern, count in zip(patterns, counts):
+                    if count > 0:
+                        results["suspicious_amounts"].append({
+                            "pattern": pattern,
+                            "count": count
+                        })
         
         return results
     
-    def _validate_dates(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _validate_dates(self, df: pd.DataFrame, now: Optional[datetime] = None) -> Dict[str, Any]:
         """Validate transaction dates"""
         results = {
             "date_issues": [],
@@ -704,22 +1073,29 @@ class CompleteBankExtractor:
             "invalid_dates": []
         }
         
+        if not len(df):
+            return results
+        
         if 'Transaction Date' in df.columns:
-            df['Transaction Date'] = pd.to_datetime(df['Transaction Date'], errors='coerce')
+            self._parse_transaction_dates(df)
+            # Both checks work on the bare datetime64 array; no row selection is built
+            dates = df['Transaction Date'].to_numpy()
             
-            # Check for future dates
-            future_dates = df[df['Transaction Date'] > datetime.now()]
-            if len(future_dates) > 0:
-                results["future_dates"] = future_dates['Transaction Date'].dt.strftime('%Y-%m-%d').tolist()
+            # Check for future dates: NaT never compares as future
+            if now is None:
+                now = datetime.now()
+            future = dates[dates > np.datetime64(now, 'ns')]
+            if len(future) > 0:
+                results["future_dates"] = np.datetime_as_string(future, unit='D').tolist()
             
             # Check for invalid dates
-            invalid_dates = df[df['Transaction Date'].isna()]
-            if len(invalid_dates) > 0:
-                results["invalid_dates"] = len(invalid_dates)
+            invalid_count = int(np.count_nonzero(np.isnat(dates)))
+            if invalid_count > 0:
+                results["invalid_dates"] = invalid_count
         
         return results
     
-    def _validate_narratives(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _validate_narratives(self, df: pd.DataFrame, narratives: Optional[pd.Series] = None) -> Dict[str, Any]:
         """Validate transaction narratives"""
         results = {
             "narrative_stats": {},
@@ -728,15 +1104,23 @@ class CompleteBankExtractor:
             "duplicate_narratives": 0
         }
         
-        if 'Narrative' in df.columns:
+        if not len(df):
+            return results
+        
+        if narratives is None and 'Narrative' in df.columns:
             narratives = df['Narrative']
-            results["narrative_stats"]["avg_length"] = narratives.str.len().mean()
-            results["narrative_stats"]["min_length"] = narratives.str.len().min()
-            results["narrative_stats"]["max_length"] = narratives.str.len().max()
+        
+        if narratives is not None:
+            # One length pass; every statistic below is a reduction over it
+            lengths = narratives.str.len()
+            results["narrative_stats"]["avg_length"] = lengths.mean()
+            results["narrative_stats"]["min_length"] = lengths.min()
+            results["narrative_stats"]["max_length"] = lengths.max()
             
-            results["empty_narratives"] = len(narratives[narratives == ''])
-            results["short_narratives"] = len(narratives[narratives.str.len() < 5])
-            results["duplicate_narratives"] = len(narratives) - len(narratives.unique())
+            results["empty_narratives"] = int((lengths == 0).sum())
+            results["short_narratives"] = int((lengths < 5).sum())
+            # unique() counted NaN as a value, so keep it in the count
+            results["duplicate_narratives"] = len(narratives) - narratives.nunique(dropna=False)
         
         return results
     
@@ -748,22 +1132,23 @@ class CompleteBankExtractor:
             "balance_consistency": True
         }
         
+        if not len(df):
+            return results
+        
         if 'Balance' in df.columns:
-            balances = df['Balance']
-            results["negative_balances"] = len(balances[balances < 0])
+            balances = df['Balance'].to_numpy(dtype=np.float64, na_value=np.nan)
+            results["negative_balances"] = int(np.count_nonzero(balances < 0))
             
-            # Check for balance consistency
-            if len(balances) > 1:
-                for i in range(1, len(balances)):
-                    if pd.notna(balances.iloc[i-1]) and pd.notna(balances.iloc[i]):
-                        # Balance should be cumulative
-                        if balances.iloc[i] < balances.iloc[i-1] and balances.iloc[i] >= 0:
-                            results["balance_consistency"] = False
-                            results["balance_issues"].append(f"Balance inconsistency at row {i+1}")
+            # Check for balance consistency: a balance should not drop to a smaller non-negative value
+            prev, curr = balances[:-1], balances[1:]
+            bad = (curr < prev) & (curr >= 0) & ~np.isnan(prev) & ~np.isnan(curr)
+            issue_rows = np.flatnonzero(bad) + 2
+            results["balance_issues"] = [f"Balance inconsistency at row {row}" for row in issue_rows.tolist()]
+            results["balance_consistency"] = not bad.any()
         
         return results
     
-    def _generate_statistics(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _generate_statistics(self, df: pd.DataFrame, amount_col: Optional[str] = None) -> Dict[str, Any]:
         """Generate statistical analysis"""
         results = {
             "monthly_summary": {},
@@ -771,45 +1156,45 @@ class CompleteBankExtractor:
             "transaction_patterns": {}
         }
         
-        if 'Transaction Date' in df.columns:
-            df['Transaction Date'] = pd.to_datetime(df['Transaction Date'])
-            
-            # Monthly summary - fix tuple key issue
-            monthly_stats = df.groupby(df['Transaction Date'].dt.to_period('M')).agg({
-                'Transaction Date': 'count',
-                'Amount (₹)': ['sum', 'mean', 'min', 'max']
-            }).round(2)
+        # The amount column is named after the detected currency
+        if amount_col is None:
+            amount_col = self._find_amount_column(df)
+        
+        if 'Transaction Date' in df.columns and amount_col:
+            self._parse_transaction_dates(df)
             
-            # Convert to proper dictionary format
-            monthly_dict = {}
-            for month in monthly_stats.index:
-                month_str = str(month)
-                monthly_dict[month_str] = {
-                    'transaction_count': int(monthly_stats.loc[month, ('Transaction Date', 'count')]),
-                    'total_amount': float(monthly_stats.loc[month, ('Amount (₹)', 'sum')]),
-                    'avg_amount': float(monthly_stats.loc[month, ('Amount (₹)', 'mean')]),
-                    'min_amount': float(monthly_stats.loc[month, ('Amount (₹)', 'min')]),
-                    'max_amount': float(monthly_stats.loc[month, ('Amount (₹)', 'max')])
-                }
-            results["monthly_summary"] = monthly_dict
+            # Monthly summary with flat columns, converted to a dict in one call
+            monthly_stats = df.groupby(df['Transaction Date'].dt.to_period('M')).agg(
+                transaction_count=('Transaction Date', 'count'),
+                total_amount=(amount_col, 'sum'),
+                avg_amount=(amount_col, 'mean'),
+                min_amount=(amount_col, 'min'),
+                max_amount=(amount_col, 'max'),
+            ).round(2)
+            monthly_stats.index = monthly_stats.index.astype(str)
+            monthly_stats = monthly_stats.astype({
+                'transaction_count': 'int64',
+                'total_amount': 'float64',
+                'avg_amount': 'float64',
+                'min_amount': 'float64',
+                'max_amount': 'float64'
+            })
+            results["monthly_summary"] = monthly_stats.to_dict('index')
         
         # Top transactions by amount
-        amount_col = None
-        for col in df.columns:
-            if 'Amount' in col:
-                amount_col = col
-                break
-        
         if amount_col:
-            top_debits = df.nlargest(5, amount_col)[['Transaction Date', 'Narrative', amount_col]]
-            top_credits = df.nsmallest(5, amount_col)[['Transaction Date', 'Narrative', amount_col]]
+            amounts = df[amount_col].to_numpy(dtype=np.float64, na_value=np.nan)
+            columns = ['Transaction Date', 'Narrative', amount_col]
+            top_debits = df.iloc[_top_k_positions(amounts, 5, largest=True)][columns]
+            top_credits = df.iloc[_top_k_positions(amounts, 5, largest=False)][columns]
             
             results["top_transactions"]["largest_debits"] = top_debits.to_dict('records')
             results["top_transactions"]["largest_credits"] = top_credits.to_dict('records')
         
         return results
     
-    def _generate_validation_summary(self, validation_results: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_validation_summary(self, validation_results: Dict[str, Any],
+                                     counters: Optional[_Counters] = None) -> Dict[str, Any]:
         """Generate validation summary"""
         summary = {
             "overall_status": "PASS",
@@ -819,13 +1204,13 @@ class CompleteBankExtractor:
             "recommendations": []
         }
         
-        # Count issues
-        for check_name, check_results in validation_results["checks"].items():
-            if isinstance(check_results, dict):
-                if "errors" in check_results:
-                    summary["total_issues"] += len(check_results["errors"])
-                if "warnings" in check_results:
-                    summary["warnings"] += len(check_results["warnings"])
+        # Count issues, unless the checks were already tallied as they ran
+        if counters is None:
+            counters = _Counters()
+            for check_results in validation_results["checks"].values():
+                counters.add(check_results)
+        summary["total_issues"] = counters.errors
+        summary["warnings"] = counters.warnings
         
         # Determine overall status
         if summary["critical_issues"] > 0:
@@ -844,36 +1229,49 @@ class CompleteBankExtractor:
     
     def _save_validation_report(self, validation_results: Dict[str, Any], report_path: str):
         """Save detailed validation report"""
-        with open(report_path, 'w') as f:
-            f.write("=" * 80 + "\n")
-            f.write("BANK STATEMENT VALIDATION REPORT\n")
-            f.write("=" * 80 + "\n\n")
-            
-            f.write(f"File: {validation_results['file_name']}\n")
-            f.write(f"Generated: {validation_results['timestamp']}\n")
-            f.write(f"Total Transactions: {validation_results['total_transactions']}\n")
-            f.write(f"Overall Status: {validation_results['summary']['overall_status']}\n\n")
-            
-            f.write("SUMMARY\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"Total Issues: {validation_results['summary']['total_issues']}\n")
-            f.write(f"Warnings: {validation_results['summary']['warnings']}\n")
-            f.write(f"Critical Issues: {validation_results['summary']['critical_issues']}\n\n")
-            
-            f.write("DETAILED RESULTS\n")
-            f.write("-" * 40 + "\n")
-            
-            for check_name, check_results in validation_results["checks"].items():
-                f.write(f"\n{check_name.upper()}:\n")
-                f.write("-" * 20 + "\n")
-                f.write(json.dumps(check_results, indent=2, default=str))
-                f.write("\n")
-            
-            if validation_results["summary"]["recommendations"]:
-                f.write("\nRECOMMENDATIONS\n")
-                f.write("-" * 40 + "\n")
-                for rec in validation_results["summary"]["recommendations"]:
-                    f.write(f"• {rec}\n")
+        # Built in memory and written with one call, so a failure never leaves half a report
+        buf = io.StringIO()
+        buf.write("=" * 80 + "\n")
+        buf.write("BANK STATEMENT VALIDATION REPORT\n")
+        buf.write("=" * 80 + "\n\n")
+        
+        buf.write(f"File: {validation_results['file_name']}\n")
+        buf.write(f"Generated: {validation_results['timestamp']}\n")
+        buf.write(f"Total Transactions: {validation_results['total_transactions']}\n")
+        buf.write(f"Overall Status: {validation_results['summary']['overall_status']}\n\n")
+        
+        buf.write("SUMMARY\n")
+        buf.write("-" * 40 + "\n")
+        buf.write(f"Total Issues: {validation_results['summary']['total_issues']}\n")
+        buf.write(f"Warnings: {validation_results['summary']['warnings']}\n")
+        buf.write(f"Critical Issues: {validation_results['summary']['critical_issues']}\n\n")
+        
+        buf.write("DETAILED RESULTS\n")
+        buf.write("-" * 40 + "\n")
+        
+        for check_name, check_results in validation_results["checks"].items():
+            buf.write(f"\n{check_name.upper()}:\n")
+            buf.write("-" * 20 + "\n")
+            buf.write(_dumps_report_section(check_results))
+            buf.write("\n")
+        
+        if validation_results["summary"]["recommendations"]:
+            buf.write("\nRECOMMENDATIONS\n")
+            buf.write("-" * 40 + "\n")
+            for rec in validation_results["summary"]["recommendations"]:
+                buf.write(f"• {rec}\n")
+        
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(buf.getvalue())
+    
+    def _process_pdf(self, pdf_path: str, output_dir: str) -> str:
+        """Extract and fix one PDF from a batch"""
+        logger.info(f"\n{'='*60}")
+        logger.info(f"📄 Processing: {os.path.basename(pdf_path)}")
+        logger.info(f"{'='*60}")
+        
+        # Extract and fix in one step
+        return self.extract_and_fix_transactions(pdf_path, output_dir)
     
     def process_all_pdfs(self, data_dir: str = "data", output_dir: str = "output"):
         """Process all PDFs in the data directory with complete extraction and fixes"""
@@ -881,7 +1279,10 @@ class CompleteBankExtractor:
             logger.error(f"Data directory '{data_dir}' not found!")
             return
         
-        pdf_files = [f for f in os.listdir(data_dir) if f.lower().endswith('.pdf')]
+        # Directory entries carry their file type, so the filter needs no extra stat calls
+        with os.scandir(data_dir) as entries:
+            pdf_files = [entry.name for entry in entries
+                         if entry.name.lower().endswith('.pdf') and entry.is_file()]
         
         if not pdf_files:
             logger.warning(f"No PDF files found in '{data_dir}'")
@@ -889,17 +1290,28 @@ class CompleteBankExtractor:
         
         logger.info(f"🚀 Found {len(pdf_files)} PDF files to process")
         
-        results = []
-        for pdf_file in pdf_files:
-            pdf_path = os.path.join(data_dir, pdf_file)
-            logger.info(f"\n{'='*60}")
-            logger.info(f"📄 Processing: {pdf_file}")
-            logger.info(f"{'='*60}")
-            
-            # Extract and fix in one step
-            result = self.extract_and_fix_transactions(pdf_path, output_dir)
-            if result:
-                results.append(result)
+        pdf_paths = [os.path.join(data_dir, pdf_file) for pdf_file in pdf_files]
+        if len(pdf_paths) == 1:
+            # A pool would only add process start-up for a single statement
+            outputs = [self._process_pdf(pdf_paths[0], output_dir)]
+        else:
+            # Each PDF is independent, so extract and fix them in worker processes.
+            # A failed worker only loses its own file; results are put back in file order
+            outputs_by_path = {}
+            max_workers = min(len(pdf_paths), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_process_one, (pdf_path, output_dir, self.config_file)): pdf_path
+                    for pdf_path in pdf_paths
+                }
+                for future in as_completed(futures):
+                    pdf_path = futures[future]
+                    try:
+                        outputs_by_path[pdf_path] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error processing {pdf_path}: {e}")
+            outputs = [outputs_by_path.get(pdf_path) for pdf_path in pdf_paths]
+        results = [result for result in outputs if result]
         
         logger.info(f"\n{'='*60}")
         logger.info(f"🎉 Successfully processed {len(results)} PDF files!")
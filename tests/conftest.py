@@ -0,0 +1,112 @@
+import os
+import random
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Tests import the package and the standalone extractor from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bank_extractor.config import ExtractorConfig  # noqa: E402
+
+DATE_SAMPLES = [
+    "15 Apr 2024", "15/04/2024", "15-04-2024", "15.04.2024", "2024-04-15",
+    "15/04/24", "15-04-24", "01 Jan 2023", "31/12/2023", "2023-12-31",
+]
+NOISE = "0123456789/-. aA"
+
+# The first rows stay on the pyarrow path; the extremes are ones Arrow would format differently
+BALANCES = [
+    [np.nan, -0.0, 250.5, 0.0001],
+    [np.nan, 1000000010535.0, 250.5, 1.0],
+    [np.nan, 1e-05, 250.5, 1.0],
+]
+
+# Letters that case-fold oddly under re.IGNORECASE (Kelvin sign, dotted I, long s, ...)
+NARRATIVE_CHARS = "tesampldumyhorkc0.1239 TESAMPLDUMYKC-/\u212aİßſı"
+
+SUSPICIOUS_PATTERN_SETS = [
+    ExtractorConfig().validation_rules["suspicious_patterns"],
+    [r"test", r"te", r"est", r"0\.0", r"0\.01", r"0\.01"],
+    [r"te.t", r"dummy"],
+    [r"kyc", r"test"],
+]
+
+# Floats against whether Arrow's string cast matches repr() for all of them
+REPR_RANGE_CASES = [
+    ([np.nan, 0.0, -0.0, 1e-4, -1e-4, 250.5, 9999999999.999998], True),
+    ([], True),
+    ([np.nextafter(1e-4, 0)], False),
+    ([5e-06], False),
+    ([1e10], False),
+    ([-1e16], False),
+    ([np.inf], False),
+]
+
+
+def _random_line(rng: random.Random) -> str:
+    """A line of date samples, digits and separators, so formats overlap and nest"""
+    parts = []
+    for _ in range(rng.randint(0, 5)):
+        if rng.random() < 0.5:
+            parts.append(rng.choice(DATE_SAMPLES))
+        else:
+            parts.append("".join(rng.choice(NOISE) for _ in range(rng.randint(1, 12))))
+    return rng.choice(["", " ", "  "]).join(parts)
+
+
+def _random_date_string(rng: random.Random) -> str:
+    """Day, month and year joined by random separators, including wrong and missing ones"""
+    day = rng.choice(["01", "15", "31", "32", "1"])
+    month = rng.choice(["04", "4", "12", "13", "Apr", "apr", "APR", "April"])
+    year = rng.choice(["2024", "24", "1999", "202"])
+    parts = [day, month, year] if rng.random() < 0.8 else [year, month, day]
+    seps = [rng.choice([" ", "  ", "\t", "/", "-", ".", "", ","]) for _ in range(2)]
+    return parts[0] + seps[0] + parts[1] + seps[1] + parts[2]
+
+
+def _per_pattern_counts(patterns, narratives):
+    """The per-pattern str.contains loop every suspicious-pattern counter must agree with"""
+    return [int(narratives.str.contains(p, case=False, na=False).sum()) for p in patterns]
+
+
+@pytest.fixture
+def random_line():
+    return _random_line
+
+
+@pytest.fixture
+def random_date_string():
+    return _random_date_string
+
+
+@pytest.fixture(params=BALANCES)
+def balances(request):
+    return request.param
+
+
+@pytest.fixture(params=REPR_RANGE_CASES)
+def repr_range_case(request):
+    return request.param
+
+
+@pytest.fixture
+def per_pattern_counts():
+    return _per_pattern_counts
+
+
+@pytest.fixture(params=SUSPICIOUS_PATTERN_SETS)
+def suspicious_patterns(request):
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def suspicious_narratives():
+    rng = random.Random(322)
+    return pd.Series(
+        ["".join(rng.choice(NARRATIVE_CHARS) for _ in range(rng.randint(0, 30))) for _ in range(5000)]
+        + ["test sample dummy", "TEST test 0.01", None, float("nan"), "", "KELVIN KTEST"],
+        dtype=object,
+    )
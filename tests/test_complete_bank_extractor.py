@@ -0,0 +1,105 @@
+"""
+Equivalence tests for the standalone extractor's fast paths.
+"""
+
+import json
+import random
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import complete_bank_extractor as cbe
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    return cbe.CompleteBankExtractor()
+
+
+def test_first_date_match_agrees_with_priority_loop(extractor, random_line):
+    rng = random.Random(203)
+    for _ in range(20000):
+        line = random_line(rng)
+        expected = next((m for m in (p.search(line) for p in extractor._date_res) if m), None)
+        match = extractor._first_date_match(line)
+        if expected is None:
+            assert match is None, line
+        else:
+            assert match is not None, line
+            assert match.span() == expected.span(), line
+
+
+def test_parse_date_skips_only_formats_that_cannot_match(extractor, random_date_string):
+    rng = random.Random(2020)
+    for _ in range(20000):
+        date_str = random_date_string(rng)
+        expected = None
+        for fmt in cbe.PARSE_DATE_FORMATS:
+            try:
+                expected = datetime.strptime(date_str, fmt)
+                break
+            except ValueError:
+                continue
+        assert extractor._parse_date(date_str) == expected, date_str
+
+
+@pytest.mark.parametrize("largest", [True, False])
+def test_top_k_positions_matches_nlargest_and_nsmallest(largest):
+    rng = np.random.default_rng(38)
+    for _ in range(1000):
+        n = int(rng.integers(0, 15))
+        # Few distinct values, so ties and NaN rows are common
+        values = rng.integers(-3, 4, n).astype(float)
+        values[rng.random(n) < 0.2] = np.nan
+        df = pd.DataFrame({"x": values})
+        expected = df.nlargest(5, "x") if largest else df.nsmallest(5, "x")
+        positions = cbe._top_k_positions(values, 5, largest=largest)
+        assert df.index[positions].tolist() == expected.index.tolist(), values
+
+
+def sample_frame(balances):
+    return pd.DataFrame({
+        "Transaction Date": pd.to_datetime(["2024-06-18", "2024-06-19", "2024-06-20", "2024-06-21"]),
+        "Narrative": ["UPI PAYMENT", "NEFT CR", "ATM WDL", "INT PD"],
+        "Amount (₹)": [10535.0, -1.25, 0.0, 1e9],
+        "Balance": balances,
+    })
+
+
+@pytest.mark.parametrize("with_time", [False, True])
+def test_write_csv_matches_pandas(extractor, tmp_path, with_time, balances):
+    pytest.importorskip("pyarrow.csv", exc_type=ImportError)
+    df = sample_frame(balances)
+    if with_time:
+        df.loc[1, "Transaction Date"] = pd.Timestamp("2024-06-19 10:30")
+    path = tmp_path / "out.csv"
+    extractor._write_csv(df, str(path))
+    assert path.read_bytes() == df.to_csv(index=False, lineterminator="\n").encode("utf-8")
+
+
+def test_arrow_formats_like_repr_accepts_only_the_exact_range(repr_range_case):
+    values, expected = repr_range_case
+    assert cbe._arrow_formats_like_repr(np.array(values, dtype=float)) is expected
+
+
+@pytest.mark.parametrize("value", [
+    1e16, -1.2345678901234568e+17, 1.5e-05, 5e-06, 1e-4, -0.0, 1 / 3, 250.5, np.nan, np.inf,
+    np.float64(7.25), np.float32(1.5), np.int64(3), 2 ** 70, None, True, "₹ 1e5 \"quoted\"\n",
+    datetime(2024, 1, 1), date(2024, 1, 1), pd.Timestamp("2024-01-01 10:30"),
+    {1: "int key"}, {"a": [], "b": {}, "c": [1, [2.5, "x"]]},
+])
+def test_report_sections_match_json(value):
+    section = {"value": value, "nested": [value]}
+    expected = json.dumps(section, indent=2, default=str, ensure_ascii=False)
+    assert cbe._dumps_report_section(section) == expected
+
+
+def test_count_suspicious_matches_per_pattern_search(tmp_path, suspicious_patterns, suspicious_narratives,
+                                                     per_pattern_counts):
+    rules = dict(cbe.CompleteBankExtractor().config["validation_rules"], suspicious_patterns=suspicious_patterns)
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"validation_rules": rules}))
+    extractor = cbe.CompleteBankExtractor(str(config_file))
+    assert extractor._count_suspicious(suspicious_narratives) == per_pattern_counts(suspicious_patterns, suspicious_narratives)
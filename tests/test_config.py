@@ -0,0 +1,29 @@
+"""
+Tests for the package suspicious-pattern matcher.
+"""
+
+import pandas as pd
+import pytest
+
+from bank_extractor.config import SuspiciousPatternMatcher
+
+
+def test_count_matches_per_pattern_search(suspicious_patterns, suspicious_narratives, per_pattern_counts):
+    matcher = SuspiciousPatternMatcher(suspicious_patterns)
+    assert matcher.count(suspicious_narratives) == per_pattern_counts(matcher.patterns, suspicious_narratives)
+
+
+def test_literal_patterns_use_the_automaton():
+    pytest.importorskip("ahocorasick")
+    assert SuspiciousPatternMatcher([r"test", r"0\.01"])._automaton is not None
+    assert SuspiciousPatternMatcher([r"te.t"])._automaton is None
+    assert SuspiciousPatternMatcher(["prüfung"])._automaton is None
+
+
+@pytest.mark.parametrize("pattern", [r"(test)", r"(?P<name>te)st", r"(a)\1"])
+@pytest.mark.filterwarnings("ignore:This pattern is interpreted as a regular expression")
+def test_capturing_groups_still_count(pattern, caplog, per_pattern_counts):
+    matcher = SuspiciousPatternMatcher([pattern])
+    assert "capturing group" in caplog.text
+    narratives = pd.Series(["TEST payment", "aa", "atest", None, "other"])
+    assert matcher.count(narratives) == per_pattern_counts(matcher.patterns, narratives)
@@ -0,0 +1,27 @@
+"""
+Tests for the package extractor's CSV writer.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bank_extractor.extractor import CompleteBankExtractor, _arrow_formats_like_repr
+
+
+def test_write_csv_matches_pandas(tmp_path, balances):
+    pytest.importorskip("pyarrow.csv", exc_type=ImportError)
+    df = pd.DataFrame({
+        "Transaction Date": ["2024-06-18", "2024-06-19", None, "2024-06-21"],
+        "Narrative": ["UPI PAYMENT", "NEFT CR", "ATM WDL", "INT PD"],
+        "Amount (₹)": [10535.0, -1.25, 0.0, 1e9],
+        "Balance": balances,
+    })
+    path = tmp_path / "out.csv"
+    CompleteBankExtractor()._write_csv(df, str(path))
+    assert path.read_bytes() == df.to_csv(index=False, lineterminator="\n").encode("utf-8")
+
+
+def test_arrow_formats_like_repr_accepts_only_the_exact_range(repr_range_case):
+    values, expected = repr_range_case
+    assert _arrow_formats_like_repr(np.array(values, dtype=float)) is expected
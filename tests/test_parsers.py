@@ -0,0 +1,44 @@
+"""
+Equivalence tests for the parser fast paths against the straightforward loops they replaced.
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from bank_extractor.config import ExtractorConfig
+from bank_extractor.parsers import UniversalParser, _parse_date_cached
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return UniversalParser(ExtractorConfig())
+
+
+def test_first_date_match_agrees_with_priority_loop(parser, random_line):
+    rng = random.Random(1722)
+    for _ in range(20000):
+        line = random_line(rng)
+        expected = next((m for m in (p.search(line) for p in parser._date_res) if m), None)
+        match = parser._first_date_match(line)
+        if expected is None:
+            assert match is None, line
+        else:
+            assert match is not None, line
+            assert match.span() == expected.span(), line
+
+
+def test_parse_date_skips_only_formats_that_cannot_match(parser, random_date_string):
+    formats = parser._date_formats
+    rng = random.Random(1718)
+    for _ in range(20000):
+        date_str = random_date_string(rng)
+        expected = None
+        for fmt in formats:
+            try:
+                expected = datetime.strptime(date_str, fmt)
+                break
+            except ValueError:
+                continue
+        assert _parse_date_cached(date_str, formats) == expected, date_str